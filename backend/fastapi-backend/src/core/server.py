@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import logging
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,11 +12,23 @@ def create_server():
     try:
         @asynccontextmanager
         async def lifespan(app: FastAPI):
+            from features.resume.services import get_resume_analyzer, close_resume_analyzer
+            from features.resume.config import ResumeAnalyzerConfig
             # Startup
             await connect_to_mongo()
+            # Optionally build the analyzer and connect to the LLM endpoint before the first request arrives
+            if ResumeAnalyzerConfig.LLM_WARMUP:
+                if ResumeAnalyzerConfig.OPENAI_API_KEY and ResumeAnalyzerConfig.OPENAI_ENDPOINT:
+                    try:
+                        await get_resume_analyzer().ai_analyzer.llm_util.warmup()
+                    except Exception as e:
+                        logger.warning(f"Failed to warm up resume analyzer, error: {str(e)}")
+                else:
+                    logger.warning("Skipping LLM warmup, OpenAI configuration is missing")
             logger.info("Application started")
             yield
             # Shutdown
+            await close_resume_analyzer()
             await close_mongo_connection()
             logger.info("Application stopped")
 
@@ -23,7 +36,9 @@ def create_server():
             title="Resume Analyser API",
             description="A production-ready FastAPI application with MongoDB",
             version="1.0.0",
-            lifespan=lifespan
+            lifespan=lifespan,
+            # Serialize every response with orjson instead of the stdlib json encoder
+            default_response_class=ORJSONResponse
         )
         
         # Add CORS middleware
@@ -37,6 +52,6 @@ def create_server():
         
         return app
     except Exception as e:
-        print(e)
+        logger.error(f"Failed to create server, error: {str(e)}")
         
         return None
\ No newline at end of file
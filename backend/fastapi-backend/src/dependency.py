@@ -38,6 +38,11 @@ async def get_current_user(
         dict: Dictionary with user id 
     """
 
+    # Already authenticated during this request, reuse the loaded user instead of querying again
+    current_user = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user
+    
     try:
         logger.info("Authenticating user..")
     
@@ -79,10 +84,11 @@ async def get_current_user(
             
         logger.info(f"Token verified, got user id: {user_id}")
             
-        return {
+        request.state.current_user = {
             "user_id": user_id,
             "user": user
         }
+        return request.state.current_user
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
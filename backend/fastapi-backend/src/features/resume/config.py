@@ -5,15 +5,44 @@ from shutil import which
 class ResumeAnalyzerConfig:
     """Configuration class for resume analyzer settings"""
     
-    # API Configuration
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-    MODEL = "llama3-8b-8192"
-    
     # OpenAI API configurations
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     OPENAI_MODEL = "gpt-4.1"
+    # Azure deployments per kind of call, the smaller one serves short templated outputs
+    ANALYSIS_MODEL = OPENAI_MODEL
+    FAST_MODEL = os.getenv("OPENAI_FAST_MODEL") or OPENAI_MODEL
     OPENAI_ENDPOINT = os.getenv("OPENAI_ENDPOINT")
     
+    # LLM input limits
+    TOKENIZER_ENCODING = "o200k_base"  # tokenizer used by gpt-4.1
+    MAX_LLM_INPUT_TOKENS = 3000  # analysis and scoring prompts
+    MAX_RESUME_PARSER_INPUT_TOKENS = 12000  # the parser has to see every section to extract it
+    MAX_PROMPT_JOB_DESCRIPTION_TOKENS = 500
+    
+    # LLM output limits
+    SCORE_MAX_TOKENS = 200  # JSON object with four scores
+    CAREER_SUGGESTION_MAX_TOKENS = 1024
+    SECTION_IMPROVEMENT_MAX_TOKENS = 1024
+    DESCRIPTION_MAX_TOKENS = 512  # @ separated bullet points of one entry
+    
+    # LLM HTTP client configuration
+    LLM_TIMEOUT_SECONDS = 120.0
+    LLM_MAX_KEEPALIVE_CONNECTIONS = 32
+    LLM_MAX_CONNECTIONS = 64
+    LLM_MAX_CONCURRENT_REQUESTS = 8
+    LLM_MAX_RETRY_ATTEMPTS = 5  # for rate limits, timeouts and provider side failures
+    LLM_MAX_RETRY_WAIT_SECONDS = 20
+    # Opt in, the warmup is a billable request sent by every worker at startup
+    LLM_WARMUP = os.getenv("LLM_WARMUP", "false").lower() == "true"
+    
+    # LLM response cache, used only for analysis style calls
+    LLM_CACHE_MAX_ENTRIES = 512
+    LLM_CACHE_TTL_SECONDS = 60 * 60
+    
+    # Results of requests sent with an Idempotency-Key header, replayed to client retries
+    IDEMPOTENCY_MAX_ENTRIES = 256
+    IDEMPOTENCY_TTL_SECONDS = 10 * 60
+    
     # OCR Configuration
     if platform.system() == "Windows":
         TESSERACT_PATH = r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
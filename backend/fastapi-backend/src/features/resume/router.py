@@ -1,15 +1,48 @@
-from fastapi import APIRouter, File, UploadFile, BackgroundTasks, HTTPException, Form, Depends, status
+from fastapi import APIRouter, File, UploadFile, BackgroundTasks, HTTPException, Form, Header, Depends, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from features.resume.schemas import ResumeAnalysisResponse, ResumeDetailsResponse
-from features.resume.services import resume_analyzer
-from typing import Optional, Annotated
+from features.resume.services import ResumeAnalyzer, get_resume_analyzer
+from typing import Optional, Annotated, AsyncIterator
 from features.resume.repository import resume_repository
-import os, json
+import os, json, tempfile
+from pathlib import PurePath
 from dependency import get_current_user
 from typing import Dict, Any
 import logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix = "/resume", tags = ["resume"])
+# Resume payloads are large nested dicts, serialize them with orjson instead of the stdlib json encoder
+router = APIRouter(prefix = "/resume", tags = ["resume"], default_response_class = ORJSONResponse)
+
+
+def _save_upload(content: bytes, filename: str) -> str:
+    """
+    Save an uploaded resume in its own file inside the temp directory
+    
+    Every upload gets a unique name, so concurrent uploads of files with the same name don't overwrite each other.
+    
+    Args:
+        content (bytes): Content of the uploaded file
+        filename (str): Original name of the uploaded file, only its extension is kept
+        
+    Returns:
+        str: Path of the saved file
+    """
+    os.makedirs("temp", exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir="temp", suffix=PurePath(filename).suffix, delete=False) as buffer:
+        buffer.write(content)
+    
+    logger.info("Successfully saved file in temp directory")
+    return buffer.name
+
+
+async def _stream_then_remove(stream: AsyncIterator[str], temp_path: str) -> AsyncIterator[str]:
+    """Forward the stream and delete the resume file once it finishes, fails or the client disconnects"""
+    try:
+        async for chunk in stream:
+            yield chunk
+    finally:
+        os.remove(temp_path)
 
 # API endpoint to analyse and extract the resume details 
 @router.post(
@@ -22,39 +55,90 @@ async def analyse_resume(
     resume_file: UploadFile = File(...),
     job_description: Optional[str] = Form(None),
     job_title: Optional[str] = Form(None),
+    idempotency_key: Optional[str] = Header(None),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
 ):
     try:
-        # Save the file temporarily
         user_id = user["user_id"]
-        os.makedirs("temp", exist_ok=True)
-        
-        # Construct full path
-        temp_path = os.path.join("temp", resume_file.filename)
-        
         content = await resume_file.read()
-        with open(temp_path, "wb") as buffer:
-            buffer.write(content)
+        
+        async def run_analysis() -> Dict[str, Any]:
+            # Save the file temporarily
+            temp_path = _save_upload(content, resume_file.filename)
+            
+            # With an idempotency key the database writes run below, inside the shared operation, so they
+            # happen once per key even when the first client disconnects or a retry gets the result.
+            # Without one they run after the response is sent.
+            analysis_tasks = BackgroundTasks() if idempotency_key else background_tasks
+            try:
+                result = await resume_analyzer.analyze_resume(
+                    background_tasks=analysis_tasks,
+                    user_id=user_id,
+                    file_path=temp_path,
+                    file_type=PurePath(resume_file.filename).suffix.lstrip('.'),
+                    target_role=job_title,
+                    job_description=job_description,
+                    resume_name=PurePath(resume_file.filename).stem
+                )
+            finally:
+                # clean the file
+                os.remove(temp_path)
+                logger.info("Deleted resume file successfully")
             
-        logger.info("Successfully saved file in temp directory")
+            if idempotency_key:
+                await analysis_tasks()
+            return result
         
-        result = resume_analyzer.analyze_resume(
-            background_tasks=background_tasks,
-            user_id=user_id,
-            file_path=temp_path,
-            file_type=resume_file.filename.split('.')[-1],
-            target_role=job_title,
-            job_description=job_description
+        # A client retry with the same Idempotency-Key gets the original result, without analysing again
+        result = await resume_analyzer.run_idempotent(
+            "analyse", 
+            user_id, 
+            idempotency_key, 
+            run_analysis,
+            payload=(content, resume_file.filename, job_title, job_description)
         )
         
-        # clean the file
-        os.remove(temp_path)
-        logger.info("Deleted resume file successfully")
-        return result
+        # Large nested analysis dict, serialize it directly with orjson
+        return ORJSONResponse(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to analyse resume, error : {str(e)}")
         raise HTTPException(status_code = 500, detail = f"Failed to analyse resume, error : {str(e)}")
 
 
+# API endpoint to stream the LLM analysis of the resume as server sent events
+@router.post(
+    "/analyse/stream",
+    description = "Stream the AI analysis of the resume as server sent events, every strength, improvement and suggestion is sent as soon as it is generated"
+)
+async def stream_resume_analysis(
+    user: dict = Depends(get_current_user),
+    resume_file: UploadFile = File(...),
+    job_description: Optional[str] = Form(""),
+    job_title: Optional[str] = Form("Software Engineer"),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
+):
+    try:
+        logger.info(f"Streaming analysis api called by user - {user['user_id']}")
+        content = await resume_file.read()
+        temp_path = _save_upload(content, resume_file.filename)
+        
+        # The file is needed until the stream finishes, so it is cleaned when the stream ends
+        return StreamingResponse(
+            _stream_then_remove(resume_analyzer.stream_resume_analysis(
+                file_path=temp_path,
+                file_type=PurePath(resume_file.filename).suffix.lstrip('.'),
+                target_role=job_title,
+                job_description=job_description
+            ), temp_path),
+            media_type="text/event-stream"
+        )
+    except Exception as e:
+        logger.error(f"Failed to stream resume analysis, error : {str(e)}")
+        raise HTTPException(status_code = 500, detail = f"Failed to stream resume analysis, error : {str(e)}")
+
+
 # API Endpoint to extract the details of the resume 
 @router.post(
     "/",
@@ -62,49 +146,76 @@ async def analyse_resume(
 )
 async def resume_extraction(
     user: dict = Depends(get_current_user),
-    resume_file: UploadFile = File(...)
+    resume_file: UploadFile = File(...),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
 ):
     try:
         user_id = user["user_id"]
         # Save the file temporarily
         logger.info("Resume builder api called")
-        os.makedirs("temp", exist_ok=True)
-        
-        # Construct full path
-        temp_path = os.path.join("temp", resume_file.filename)
-        
         content = await resume_file.read()
-        with open(temp_path, "wb") as buffer:
-            buffer.write(content)
-            
-        logger.info("Successfully saved file in temp directory")
+        temp_path = _save_upload(content, resume_file.filename)
         
-        result = await resume_analyzer.get_resume_details(
-            user_id=user_id,
-            file_path=temp_path
-        )
-        
-        # clean the file
-        os.remove(temp_path)
+        try:
+            result = await resume_analyzer.get_resume_details(
+                user_id=user_id,
+                file_path=temp_path,
+                resume_name=PurePath(resume_file.filename).stem
+            )
+        finally:
+            # clean the file
+            os.remove(temp_path)
         
         return result
     except Exception as e:
         logger.error(f"Failed to analyse resume, error : {str(e)}")
         raise HTTPException(status_code = 500, detail = f"Failed to analyse resume, error : {str(e)}")
     
+# API Endpoint to stream an AI optimized version of the resume
+@router.post(
+    "/optimized-resume",
+    description="Stream an AI optimized resume for the target role as plain text while it is generated"
+)
+async def stream_optimized_resume(
+    user: dict = Depends(get_current_user),
+    resume_file: UploadFile = File(...),
+    job_title: str = Form(...),
+    job_description: Optional[str] = Form(""),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
+):
+    try:
+        logger.info(f"Optimized resume api called by user - {user['user_id']}")
+        content = await resume_file.read()
+        temp_path = _save_upload(content, resume_file.filename)
+        
+        # The file is needed until the stream finishes, so it is cleaned when the stream ends
+        return StreamingResponse(
+            _stream_then_remove(resume_analyzer.stream_optimized_resume(
+                file_path=temp_path,
+                file_type=PurePath(resume_file.filename).suffix.lstrip('.'),
+                target_role=job_title,
+                job_description=job_description
+            ), temp_path),
+            media_type="text/plain"
+        )
+    except Exception as e:
+        logger.error(f"Failed to generate optimized resume, error : {str(e)}")
+        raise HTTPException(status_code = 500, detail = f"Failed to generate optimized resume, error : {str(e)}")
+    
 # API Endpoint to get questions related to skills
 @router.post(
     "/skill-assessment", 
     description="This will give 10 mcq questions based on soft and technical skills provided."
 )
-def get_mcq_questions(
+async def get_mcq_questions(
     technical_skills: str = Form(...),
     soft_skills: str = Form(...),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
 ):
     try:
         logger.info("Skill-assessment API called")
-        return resume_analyzer.generate_skill_assessment_questions(technical_skills=technical_skills, soft_skills=soft_skills)
+        return await resume_analyzer.generate_skill_assessment_questions(technical_skills=technical_skills, soft_skills=soft_skills)
     except Exception as e:
         logger.error(f"Failed to generate MCQ question based on skills provided, error : {str(e)}")
         raise HTTPException(
@@ -117,15 +228,16 @@ def get_mcq_questions(
     "/skill-assessment-score", 
     description="This will give comprehensive analysis of the assessment and also it will suggest some job roles."
 )
-def get_assessment_score(
+async def get_assessment_score(
     skills: str = Form(...),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
 ):
     try:
         '''It will calculate skill assessment score and it will also suggest some job roles depending upon the score
         ''' 
         logger.info("Skill-assessment-score API called") 
-        return resume_analyzer.analyse_assessment_score(skills)
+        return await resume_analyzer.analyse_assessment_score(skills)
     except Exception as e:
         logger.error(f"Failed to analyse MCQ question based on provided skill wise scores, error: {str(e)}")
         raise HTTPException(
@@ -160,16 +272,17 @@ async def delete_resume(
     "/project",
     description="Get project description for project section"
 )
-def get_project_description_suggestion(
+async def get_project_description_suggestion(
     project_name: str = Form(...),
     tech_stack: str = Form(...),
     bullet_points: Optional[str] = Form("@"),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
 ):
     try:
         user_id = user["user_id"]
         logger.info(f"Project endpoint called to get AI generated description point, called by user - {user_id}")
-        return resume_analyzer.get_project_enhanced_description(project_name, tech_stack, bullet_points)
+        return await resume_analyzer.get_project_enhanced_description(project_name, tech_stack, bullet_points)
     except Exception as e:
         logger.error(f"Failed to generate AI Suggestion for project section, error message: {str(e)}")
         raise HTTPException(
@@ -184,11 +297,12 @@ async def get_experience_description_suggestion(
     position: str = Form(...),
     location: str = Form(...),
     bullet_points: Optional[str] = Form("@"),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
 ):
     try:
         logger.info(f"Experience endpoint called to get AI generated description point, called by user-{user['user_id']}")
-        return resume_analyzer.get_experience_enhanced_description(organisation_name, position, location, bullet_points)
+        return await resume_analyzer.get_experience_enhanced_description(organisation_name, position, location, bullet_points)
     except Exception as e:
         logger.error(f"Failed to generate AI Suggestion for experience section, error message: {str(e)}")
         raise HTTPException(
@@ -206,12 +320,13 @@ async def get_extracurricular_description_suggestion(
     position: str = Form(...),
     location: str = Form(...),
     bullet_points: Optional[str] = Form("@"),
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
 ):
     try:
         logger.info(f"Extracurricular endpoint called to get AI generated description point, called by user-{user['user_id']}")
         
-        return resume_analyzer.get_extracurricular_enhanced_description(organisation_name, position, location, bullet_points)
+        return await resume_analyzer.get_extracurricular_enhanced_description(organisation_name, position, location, bullet_points)
     except Exception as e:
         logger.error(f"Failed to generate AI Suggestion for extracurricular section, error message: {str(e)}")
         raise HTTPException(
@@ -224,14 +339,17 @@ async def get_extracurricular_description_suggestion(
     "/ats-score",
     description="Get ATS score of resume by sending the json object of the resume"
 )
-def get_ats_score_of_resume(
+async def get_ats_score_of_resume(
     user: dict = Depends(get_current_user),
-    resume_json: str = Form(...)
+    resume_json: str = Form(...),
+    resume_analyzer: ResumeAnalyzer = Depends(get_resume_analyzer)
 ):
     try:
-        logger.info(f"ATS score endpoint called with, resume object as:  {resume_json}")
+        logger.info(f"ATS score endpoint called by user - {user['user_id']}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"ATS score resume object: {resume_json}")
         
-        return resume_analyzer.get_ats_score(resume_json)        
+        return await resume_analyzer.get_ats_score(resume_json)        
     except Exception as e:
         logger.error(f"Failed to provide ats score, error: {str(e)}")
         raise HTTPException(
@@ -1,13 +1,18 @@
-import logging, json
+import logging, json, asyncio, threading
+from pathlib import PurePath
 from fastapi import HTTPException, BackgroundTasks, status
 from features.resume.utils.utils import (
     AIAnalyzer, TextExtractor, NLPAnalyzer, PersonalInfoExtractor,
-    SectionExtractor, SkillsAnalyzer, JobMatchCalculator, ResponseFormatter, ResumeDetailsExtractor
+    SectionExtractor, SkillsAnalyzer, JobMatchCalculator, ResponseFormatter, LLMTextPreparer
 )
+from features.resume.utils.ai_config import LLMResponseCache
+from features.resume.config import ResumeAnalyzerConfig
 from features.resume.repository import resume_repository
 
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Tuple, AsyncIterator
 from datetime import datetime
+from time import perf_counter
+import numpy as np
 # from features.resume.schemas import (
 #      NLPAnalysis, ResumeDetails, PersonalInfo
 # )
@@ -16,6 +21,32 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Response for resumes without any extractable text, same shape as the failed analysis response
+EMPTY_RESUME_RESPONSE = {
+    "success": False,
+    "errorCode": 42200,
+    "errorMsg": "Resume analysis failed: no text could be extracted from the resume",
+    "result": None
+}
+
+
+def _calculate_scores_kernel(totals: np.ndarray, corrects: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Compute per skill and overall scores from arrays of question counts
+    
+    Args:
+        totals (np.ndarray): Total questions per skill
+        corrects (np.ndarray): Correctly answered questions per skill
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, float]: Per skill scores, mask of skills that had questions and the overall score
+    """
+    # Skills without questions get no score and are left out of the overall score
+    answered = totals > 0
+    scores = np.round(np.divide(corrects, totals, out=np.zeros_like(corrects), where=answered) * 100, 2)
+    overall_score = round(float(scores[answered].mean()), 2) if answered.any() else 0.0
+    return scores, answered, overall_score
+
+
 class ResumeAnalyzer:
     """
     Main Resume Analyzer class that orchestrates all analysis components
@@ -37,20 +68,139 @@ class ResumeAnalyzer:
         self.skills_analyzer = SkillsAnalyzer(logger)
         self.job_match_calculator = JobMatchCalculator(logger)
         self.ai_analyzer = AIAnalyzer(logger)
-        self.resume_details_extractor = ResumeDetailsExtractor(logger)
         self.response_formatter = ResponseFormatter(logger)
+        self.llm_text_preparer = LLMTextPreparer()
+        
+        # Results of idempotent requests, and the ones still running so retries can join them
+        self.idempotent_results = LLMResponseCache(
+            max_entries=ResumeAnalyzerConfig.IDEMPOTENCY_MAX_ENTRIES,
+            ttl_seconds=ResumeAnalyzerConfig.IDEMPOTENCY_TTL_SECONDS
+        )
+        self._inflight_idempotent_requests: Dict[str, Tuple[str, asyncio.Task]] = {}
         
         logger.info("Resume Analyzer initialized successfully")
     
+    async def run_idempotent(
+        self,
+        operation_name: str,
+        user_id: str,
+        idempotency_key: Optional[str],
+        operation: Callable[[], Awaitable[Any]],
+        payload: Tuple[Any, ...] = ()
+    ) -> Any:
+        """
+        Run an expensive operation once per client supplied idempotency key
+        
+        A client retrying with the same key joins the original request while it is still running,
+        and gets the stored result afterwards, instead of paying for the LLM calls again. Failed
+        operations are not stored, so they can be retried. A key reused with a different payload
+        is rejected instead of replaying the result of the other payload.
+        
+        Args:
+            operation_name (str): Name of the operation, keys are scoped per operation
+            user_id (str): Id of the user, keys are scoped per user
+            idempotency_key (Optional[str]): Value of the Idempotency-Key header, runs the operation directly when missing
+            operation (Callable[[], Awaitable[Any]]): Operation to run
+            payload (Tuple[Any, ...]): Request inputs the operation depends on, hashed and stored with the key
+            
+        Raises:
+            HTTPException: 422 when the key was already used with a different payload
+            
+        Returns:
+            Any: Result of the operation
+        """
+        if not idempotency_key:
+            return await operation()
+        
+        key = LLMResponseCache.make_key(operation_name, user_id, idempotency_key)
+        payload_hash = LLMResponseCache.make_key(*payload)
+        
+        def check_payload(stored_payload_hash: str) -> None:
+            if stored_payload_hash != payload_hash:
+                logger.warning(f"Idempotency key of {operation_name} reused with a different payload")
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Idempotency-Key was already used with a different request"
+                )
+        
+        stored_result = self.idempotent_results.get(key)
+        if stored_result is not None:
+            stored_payload_hash, result = stored_result
+            check_payload(stored_payload_hash)
+            logger.info(f"Replaying stored result of {operation_name} for idempotency key")
+            return result
+        
+        inflight = self._inflight_idempotent_requests.get(key)
+        if inflight is None:
+            inflight_request = asyncio.ensure_future(operation())
+            self._inflight_idempotent_requests[key] = (payload_hash, inflight_request)
+            
+            def store_result(task: asyncio.Task) -> None:
+                self._inflight_idempotent_requests.pop(key, None)
+                if not task.cancelled() and task.exception() is None:
+                    self.idempotent_results.set(key, (payload_hash, task.result()))
+            
+            inflight_request.add_done_callback(store_result)
+        else:
+            inflight_payload_hash, inflight_request = inflight
+            check_payload(inflight_payload_hash)
+            logger.info(f"Joining in-flight {operation_name} request with the same idempotency key")
+        # Shielded so a client going away does not cancel the request for its retry
+        return await asyncio.shield(inflight_request)
+    
+    def _load_resume(self, file_path: str, file_type: str) -> Tuple[str, Dict[str, List[str]]]:
+        """
+        Extract text and sections of a resume file
+        
+        Args:
+            file_path (str): Path to the resume file
+            file_type (str): Type of file (pdf, docx, txt)
+            
+        Returns:
+            Tuple[str, Dict[str, List[str]]]: Extracted resume text and its sections
+        """
+        resume_text = self.text_extractor.extract_text_from_file(file_path, file_type)
+        sections = self.section_extractor.extract_sections(resume_text)
+        return resume_text, sections
+    
+    def _match_job_description(
+        self, 
+        resume_text: str, 
+        job_description: str
+    ) -> Tuple[List[str], List[str], float, float]:
+        """
+        Match resume against job description, CPU bound so it is meant to run in the thread pool
+        
+        Args:
+            resume_text (str): Resume text
+            job_description (str): Job description text
+            
+        Returns:
+            Tuple[List[str], List[str], float, float]: Matched skills, missing skills, skill match percent and job match score
+        """
+        if not job_description or not job_description.strip():
+            # No job description to match against, skip skill matching and vectorization
+            return [], [], 0.0, 0.0
+        
+        # Step 5: Match skills with job description
+        matched_skills, missing_skills, skill_match_percent = \
+            self.skills_analyzer.match_skills_with_job_description(resume_text, job_description)
+        
+        # Step 6: Calculate job match score
+        job_match_score = self.job_match_calculator.calculate_cosine_similarity_score(
+            resume_text, job_description
+        )
+        return matched_skills, missing_skills, skill_match_percent, job_match_score
     
-    def analyze_resume(
+    async def analyze_resume(
         self, 
         background_tasks: BackgroundTasks,
         user_id: str,
         file_path: str, 
         file_type: str, 
         target_role: str = "Software Engineer",
-        job_description: str = ""
+        job_description: str = "",
+        resume_name: Optional[str] = None
     ) -> Any:
         """
         Perform comprehensive resume analysis
@@ -63,52 +213,68 @@ class ResumeAnalyzer:
             file_type (str): Type of file (pdf, docx, txt)
             target_role (str): Target job role for analysis
             job_description (str): Job description for matching (optional)
+            resume_name (str): Name to store the resume under, defaults to the file name (optional)
             
         Returns:
             Dict[str, Any]: Comprehensive analysis results in structured format
         """
         try:
-            logger.info(f"Starting resume analysis for {file_type} file: {file_path}")
-            
-            # Step 1: Extract text from file
-            logger.info("Step 1: Extracting text from file")
-            resume_text = self.text_extractor.extract_text_from_file(file_path, file_type)
-            
-            # Step 2: Extract personal information
-            logger.info("Step 2: Extracting resume information")
-            resume_details: Dict[str, Any] = self.ai_analyzer.get_resume_details(text=resume_text)
-            # personal_info = self.personal_info_extractor.extract_personal_info(resume_text)
-            
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug(f"Starting resume analysis for {file_type} file: {file_path}")
+            
+            # Per step timings in seconds, logged once at the end of the analysis
+            timings: Dict[str, float] = {}
+            step_start = analysis_start = perf_counter()
+            
+            def record_step(step: str) -> None:
+                nonlocal step_start
+                now = perf_counter()
+                timings[step] = round(now - step_start, 4)
+                step_start = now
+                if debug_enabled:
+                    logger.debug(f"Completed step: {step}")
+            
+            # Step 1: Extract text from file, in the thread pool since parsing blocks
+            resume_text = await asyncio.to_thread(self.text_extractor.extract_text_from_file, file_path, file_type)
+            # Compacted text for the resume parser, which needs every section, and its shorter
+            # prefix shared by the analysis and scoring calls
+            parser_text = self.llm_text_preparer.prepare_llm_text(
+                resume_text, ResumeAnalyzerConfig.MAX_RESUME_PARSER_INPUT_TOKENS
+            )
+            llm_text = self.llm_text_preparer.truncate_to_tokens(
+                parser_text, ResumeAnalyzerConfig.MAX_LLM_INPUT_TOKENS
+            )
+            record_step("text_extraction")
+            
+            if not llm_text:
+                # Nothing to analyse, skip the LLM calls and formatting altogether
+                logger.warning(f"No text could be extracted from the {file_type} resume, skipping analysis")
+                return EMPTY_RESUME_RESPONSE
+            
+            # Step 2: Extract resume information and run all LLM analysis as one batch, while the
+            # CPU bound job description matching (Steps 5 and 6) runs in the thread pool
+            llm_results, job_match_results = await asyncio.gather(
+                self.ai_analyzer.get_batched_resume_analysis(
+                    llm_text, target_role, job_description, parser_text=parser_text
+                ),
+                asyncio.to_thread(self._match_job_description, resume_text, job_description)
+            )
+            resume_details, overall_resume_analysis, ats_score, section_analysis = llm_results
+            matched_skills, missing_skills, skill_match_percent, job_match_score = job_match_results
+            # resume_doc = self.nlp_analyzer.parse_text(resume_text)
+            # personal_info = self.personal_info_extractor.extract_personal_info(resume_text, resume_doc)
+            record_step("analysis")
             
-            # Step 3: Perform NLP analysis
-            logger.info("Step 3: Performing NLP analysis - skip....")
-            # nlp_analysis = self.nlp_analyzer.analyze_text_with_nlp(resume_text, target_role)
+            # Step 3: Perform NLP analysis - skipped
+            # nlp_analysis = self.nlp_analyzer.analyze_text_with_nlp(resume_text, target_role, resume_doc)
             
-            # Step 4: Analyze skills
-            logger.info("Step 4: Analyzing skills, skipped...")
+            # Step 4: Analyze skills - skipped
             # get tech skills and soft skills
             
             # tech_skills, soft_skills = self.skills_analyzer.detect_skills_by_groups(resume_text)
             
-            # Step 5: Match skills with job description
-            logger.info("Step 5: Matching skills with job description")
-            matched_skills, missing_skills, skill_match_percent = \
-                self.skills_analyzer.match_skills_with_job_description(resume_text, job_description)
-            
-            
-            # Step 6: Calculate job match score
-            logger.info("Step 6: Calculating job match score")
-            job_match_score = self.job_match_calculator.calculate_cosine_similarity_score(
-                resume_text, job_description
-            )
-            
-            # Step 7: Get AI analysis and scoring
-            logger.info("Step 7: Getting AI analysis and scoring")
-            overall_resume_analysis = self.ai_analyzer.get_llm_analysis(
-                resume_text, target_role, job_description
-            )
-            
-            # matched and missing skills from ai
+            # Step 7: matched and missing skills from ai
             matched_skills = overall_resume_analysis.get("matched_skills", [])
             missing_skills = overall_resume_analysis.get("missing_skills", [])
             
@@ -116,22 +282,13 @@ class ResumeAnalyzer:
             overall_resume_analysis.pop("matched_skills", [])
             overall_resume_analysis.pop("missing_skills", [])
             
-            # print once
-            print(f"Matched skills -> {matched_skills}")
-            print(f"Missing skills -> {missing_skills}")
-            ats_score = self.ai_analyzer.compute_resume_score(
-                resume_text, target_role, job_description
-            )
-            
-            logger.info("Step 8: Getting section wise analysis")
-            section_analysis = self.ai_analyzer.get_section_wise_analysis(text=resume_text, target_role=target_role, job_description=job_description)
+            if debug_enabled:
+                logger.debug(f"Matched skills -> {matched_skills}")
+                logger.debug(f"Missing skills -> {missing_skills}")
             
-            # Step 8: Format response in proper format
-            logger.info("Step 9: Formatting results for better response")
-            
-            # Step 9: Update database in background
+            # Step 9: Format response in proper format
             resume_metadata = {
-                "resume_name": file_path.split(".")[0].split("\\")[1],
+                "resume_name": resume_name or PurePath(file_path).stem,
                 "is_primary": True,
             }
             
@@ -139,8 +296,6 @@ class ResumeAnalyzer:
             # Add ats score in resume details dictionary
             resume_details_for_db["ats_score"] = float(ats_score["ats_score"])
             
-            logger.info("Step 10: Updating database in background with both resume analysis and resume details")
-            
             llm_analysis = {
                 "overall_analysis": overall_resume_analysis,
                 "section_wise_analysis": section_analysis
@@ -172,6 +327,8 @@ class ResumeAnalyzer:
                 "job_title": target_role
             }
             
+            # Step 10: Update database with both resume analysis and resume details, through the
+            # tasks given by the caller. The writes are async Motor calls and do not hold a worker thread.
             background_tasks.add_task(
                 resume_repository.create_resume_detail_and_analysis,
                 user_id,
@@ -188,11 +345,18 @@ class ResumeAnalyzer:
                 "job_title": target_role
             }
             
-            logger.info("Resume analysis completed successfully")
+            record_step("formatting")
+            timings["total"] = round(perf_counter() - analysis_start, 4)
+            logger.info(
+                "Resume analysis completed successfully, file_type: %s, timings: %s", 
+                file_type, 
+                timings,
+                extra={"timings": timings, "file_type": file_type, "target_role": target_role}
+            )
             return response
             
-        except HTTPException as http_exception:
-            raise HTTPException
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error in resume analysis: {e}")
             return {
@@ -214,7 +378,7 @@ class ResumeAnalyzer:
             logger.error(f"Failed to convert json string into python object, error: {str(e)}")
             return None
         
-    def get_project_enhanced_description(
+    async def get_project_enhanced_description(
         self,
         project_name: str,
         tech_stack: str,
@@ -226,7 +390,7 @@ class ResumeAnalyzer:
             # convert bullet points into python list
             bullet_points = bullet_points.split("@")
             
-            response = self.ai_analyzer.generate_project_section_description(project_name, tech_stack, bullet_points)
+            response = await self.ai_analyzer.generate_project_section_description(project_name, tech_stack, bullet_points)
             if response is None:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -245,7 +409,7 @@ class ResumeAnalyzer:
             )
 
         
-    def get_experience_enhanced_description(
+    async def get_experience_enhanced_description(
         self,
         organisation_name: str, 
         position: str, 
@@ -256,7 +420,7 @@ class ResumeAnalyzer:
             logger.info("Sent all experience details to llm for generating description")
             bullet_points = bullet_points.split("@")
             
-            response = self.ai_analyzer.generate_experience_section_description(organisation_name, position, location, bullet_points)
+            response = await self.ai_analyzer.generate_experience_section_description(organisation_name, position, location, bullet_points)
             if response is None:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -275,7 +439,7 @@ class ResumeAnalyzer:
                 detils=f"Error while generating experience description, error message: {str(e)}"
             )
             
-    def get_extracurricular_enhanced_description(
+    async def get_extracurricular_enhanced_description(
         self,
         organisation_name: str, 
         position: str, 
@@ -286,7 +450,7 @@ class ResumeAnalyzer:
             logger.info("Sent all extracurricular details to llm for generating description")
             bullet_points = bullet_points.split("@")
             
-            response = self.ai_analyzer.generate_extracurricular_section_description(organisation_name, position, location, bullet_points)
+            response = await self.ai_analyzer.generate_extracurricular_section_description(organisation_name, position, location, bullet_points)
             
             if response is None:
                 raise HTTPException(
@@ -306,7 +470,7 @@ class ResumeAnalyzer:
                 detils=f"Error while generating extracurricular description, error message: {str(e)}"
             )
         
-    def improve_resume_section(
+    async def improve_resume_section(
         self, 
         section_text: str, 
         section_name: str, 
@@ -327,14 +491,14 @@ class ResumeAnalyzer:
         """
         try:
             logger.info(f"Improving {section_name} section")
-            return self.ai_analyzer.improve_section_with_ai(
+            return await self.ai_analyzer.improve_section_with_ai(
                 section_text, section_name, target_role, job_description
             )
         except Exception as e:
             logger.error(f"Error improving section: {e}")
             return f"Error improving section: {str(e)}"
     
-    def generate_optimized_resume(
+    async def generate_optimized_resume(
         self, 
         file_path: str, 
         file_type: str, 
@@ -356,17 +520,79 @@ class ResumeAnalyzer:
         try:
             logger.info("Generating AI-optimized resume")
             
-            # Extract text and sections
-            resume_text = self.text_extractor.extract_text_from_file(file_path, file_type)
-            sections = self.section_extractor.extract_sections(resume_text)
+            # Extract sections, in the thread pool since parsing blocks
+            _, sections = await asyncio.to_thread(self._load_resume, file_path, file_type)
             
             # Generate optimized resume
-            return self.ai_analyzer.generate_ai_resume(sections, target_role, job_description)
+            return await self.ai_analyzer.generate_ai_resume(sections, target_role, job_description)
             
         except Exception as e:
             logger.error(f"Error generating optimized resume: {e}")
             return f"Error generating resume: {str(e)}"
     
+    async def stream_optimized_resume(
+        self, 
+        file_path: str, 
+        file_type: str, 
+        target_role: str,
+        job_description: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Stream a complete AI-optimized resume as it is generated
+        
+        Args:
+            file_path (str): Path to the original resume file
+            file_type (str): Type of file (pdf, docx, txt)
+            target_role (str): Target job role
+            job_description (str): Job description (optional)
+            
+        Yields:
+            str: Chunks of the AI-generated optimized resume
+        """
+        try:
+            logger.info("Streaming AI-optimized resume")
+            
+            _, sections = await asyncio.to_thread(self._load_resume, file_path, file_type)
+            async for chunk in self.ai_analyzer.stream_ai_resume(sections, target_role, job_description):
+                yield chunk
+                
+        except Exception as e:
+            # Headers are already sent, so the error can only end the stream
+            logger.error(f"Error streaming optimized resume: {e}")
+    
+    async def stream_resume_analysis(
+        self, 
+        file_path: str, 
+        file_type: str, 
+        target_role: str,
+        job_description: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Stream the LLM analysis of a resume as server sent events while it is generated
+        
+        Args:
+            file_path (str): Path to the resume file
+            file_type (str): Type of file (pdf, docx, txt)
+            target_role (str): Target job role
+            job_description (str): Job description (optional)
+            
+        Yields:
+            str: Server sent events, one per analysis entry and a final one with the complete analysis
+        """
+        try:
+            logger.info("Streaming LLM analysis of resume")
+            
+            resume_text = await asyncio.to_thread(self.text_extractor.extract_text_from_file, file_path, file_type)
+            llm_text = self.llm_text_preparer.prepare_llm_text(resume_text)
+            
+            async for event in self.ai_analyzer.stream_llm_analysis(llm_text, target_role, job_description):
+                yield f"data: {json.dumps(event)}\n\n"
+                
+        except Exception as e:
+            # Headers are already sent, so the error can only be reported as the last event
+            logger.error(f"Error streaming resume analysis: {e}")
+            yield f"data: {json.dumps({'event': 'error', 'detail': 'Failed to analyse resume'})}\n\n"
+    
     def get_health_status(self) -> Dict[str, Any]:
         """
         Get health status of all components
@@ -376,21 +602,23 @@ class ResumeAnalyzer:
         Returns:
             Dict[str, Any]: Health status of all components
         """
+        # Lazily loaded models are reported as not loaded instead of being loaded by the health check
+        model_status = self.nlp_analyzer.get_model_status()
         return {
             "status": "healthy",
             "components": {
                 "text_extractor": "ready",
-                "nlp_analyzer": "ready" if self.nlp_analyzer.nlp_model else "unavailable",
-                "ai_analyzer": "ready" if self.ai_analyzer.groq_client else "unavailable",
-                "classifier": "ready" if self.nlp_analyzer.classifier else "unavailable"
+                "nlp_analyzer": model_status["nlp_analyzer"],
+                "ai_analyzer": "ready" if self.ai_analyzer.llm_util.openai_client else "unavailable",
+                "classifier": model_status["classifier"]
             },
             "version": "1.0.0",
             "timestamp": datetime.now().isoformat()
         }
         
-    def generate_skill_assessment_questions(self, soft_skills: str, technical_skills: str):
+    async def generate_skill_assessment_questions(self, soft_skills: str, technical_skills: str):
         try:
-            questions = self.ai_analyzer.get_mcq_for_skill_assessment(soft_skills=soft_skills, technical_skills=technical_skills)
+            questions = await self.ai_analyzer.get_mcq_for_skill_assessment(soft_skills=soft_skills, technical_skills=technical_skills)
             
             if questions is None:
                 raise HTTPException(
@@ -412,7 +640,7 @@ class ResumeAnalyzer:
             )
 
 
-    def analyse_assessment_score(self, skills: str):
+    async def analyse_assessment_score(self, skills: str):
         try:
             logger.info("Converting given skills json string into python object")
             
@@ -433,7 +661,7 @@ class ResumeAnalyzer:
                 
             overall_score, skill_scores = self.calculate_scores(skills=skill_list)
             
-            suggestions = self.ai_analyzer.get_career_suggestions_based_on_score(skill_scores=skill_scores, overall_score=overall_score)
+            suggestions = await self.ai_analyzer.get_career_suggestions_based_on_score(skill_scores=skill_scores, overall_score=overall_score)
             return {
                 "status": True,
                 "message": "Succesfully analyzed the result and provided career suggestion",
@@ -461,32 +689,22 @@ class ResumeAnalyzer:
             
             Tuple where first member is overall score and second one is list of an object which contains name of the skill and score of the skill
         """
-        skill_scores = []
-        total_score = 0
-        scored_skills_count = 0
-
-        for item in skills:
-            skill = item["skill"]
-            total = item["total_questions"]
-            correct = item["correct_questions"]
-
-            if total == 0:
-                score = None  # No questions answered for this skill
-            else:
-                score = round((correct / total) * 100, 2)
-                total_score += score
-                scored_skills_count += 1
-
-            skill_scores.append({
-                "skill": skill,
-                "score": score
-            })
-
-        overall_score = round(total_score / scored_skills_count, 2) if scored_skills_count else 0.0
+        totals = np.fromiter((item["total_questions"] for item in skills), dtype=np.float64, count=len(skills))
+        corrects = np.fromiter((item["correct_questions"] for item in skills), dtype=np.float64, count=len(skills))
+        
+        scores, answered, overall_score = _calculate_scores_kernel(totals, corrects)
+        
+        skill_scores = [
+            {
+                "skill": item["skill"],
+                "score": float(score) if has_questions else None
+            }
+            for item, score, has_questions in zip(skills, scores, answered)
+        ]
 
         return overall_score, skill_scores
 
-    async def get_resume_details(self, user_id: str, file_path: str) -> Dict[str, any]:
+    async def get_resume_details(self, user_id: str, file_path: str, resume_name: Optional[str] = None) -> Dict[str, any]:
         try:
             if file_path is None:
                 raise HTTPException(
@@ -494,20 +712,28 @@ class ResumeAnalyzer:
                     detail="Failed to extract details from resume, resume file not found"
                 )
             
+            resume_path = PurePath(file_path)
+            
             logger.info("Step-1: extract the text from resume")
-            text = self.text_extractor.extract_text_from_file(
-                file_path=file_path, 
-                file_type=file_path.split(".")[-1]
+            text = await asyncio.to_thread(
+                self.text_extractor.extract_text_from_file,
+                file_path, 
+                resume_path.suffix.lstrip(".")
             )
+            parser_text = self.llm_text_preparer.prepare_llm_text(
+                text, ResumeAnalyzerConfig.MAX_RESUME_PARSER_INPUT_TOKENS
+            )
+            text = self.llm_text_preparer.truncate_to_tokens(parser_text, ResumeAnalyzerConfig.MAX_LLM_INPUT_TOKENS)
                     
-            logger.info("Step 2: Extracting resume information")
-            resume_details: Dict[str, Any] = self.ai_analyzer.get_resume_details(text) 
+            # Both LLM calls only need the resume text, so run them concurrently
+            logger.info("Step 2: Extracting resume information and calculating ats score")
+            resume_details, ats_score = await asyncio.gather(
+                self.ai_analyzer.get_resume_details(parser_text),
+                self.ai_analyzer.compute_resume_score(text=text, target_role="No specific target role", job_description="No specific job description")
+            )
             
             if resume_details:
                 resume_details = resume_details["resume_details"]
-            
-            logger.info("Step 3: Calculating ats score")
-            ats_score = self.ai_analyzer.compute_resume_score(text=text, target_role="No specific target role", job_description="No specific job description")
 
             if ats_score:
                 ats_score = ats_score["ats_score"]
@@ -516,7 +742,7 @@ class ResumeAnalyzer:
             resume_details["ats_score"] = float(ats_score)
             
             resume_metadata =  {
-                "resume_name": file_path.split(".")[0].split("\\")[1],
+                "resume_name": resume_name or resume_path.stem,
                 "is_primary": True
             }
             
@@ -543,7 +769,7 @@ class ResumeAnalyzer:
                 detail=f"Failed to extract details from resume, {str(e)}"
             )
             
-    def get_ats_score(self, resume_json: str):
+    async def get_ats_score(self, resume_json: str):
         try:
             
             # Convert resume json string to python dictionary
@@ -563,7 +789,7 @@ class ResumeAnalyzer:
                     detail=f"Failed to convert resume json text to correct json format, error: {str(e)}"
                 )
                 
-            ats_score = self.ai_analyzer.get_ats_score(resume_data=resume_data)    
+            ats_score = await self.ai_analyzer.get_ats_score(resume_data=resume_data)    
             
             
             if ats_score is None:
@@ -584,5 +810,20 @@ class ResumeAnalyzer:
 
         
     
-# Create a single instance and use it 
-resume_analyzer = ResumeAnalyzer()
\ No newline at end of file
+_resume_analyzer: Optional[ResumeAnalyzer] = None
+_resume_analyzer_lock = threading.Lock()
+
+def get_resume_analyzer() -> ResumeAnalyzer:
+    """Dependency which gives the single ResumeAnalyzer instance, built on first use (the first request, or the startup warmup when enabled)"""
+    global _resume_analyzer
+    # Sync dependencies run in the thread pool, so concurrent first requests must not build it twice
+    if _resume_analyzer is None:
+        with _resume_analyzer_lock:
+            if _resume_analyzer is None:
+                _resume_analyzer = ResumeAnalyzer()
+    return _resume_analyzer
+
+async def close_resume_analyzer() -> None:
+    """Close the LLM client of the ResumeAnalyzer, if a request or the warmup built it"""
+    if _resume_analyzer is not None:
+        await _resume_analyzer.ai_analyzer.llm_util.close()
@@ -1,24 +1,26 @@
 """
 Module which contains all the essential methods which involves communicating with AI and generate something
 """
-import logging
+import logging, asyncio
 from features.resume.config import ResumeAnalyzerConfig
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple, AsyncIterator
 from features.resume.utils.ai_config import AIConfig
 from features.resume.utils.resume_detail_extractor import ResumeDetailsExtractor
 from features.resume.utils.prompt_creator import PromptCreator
+from features.resume.utils.json_stream_parser import JSONArrayItemStreamParser
 logger = logging.getLogger(__name__)
 
 class AIAnalyzer:
-    """Handles AI-powered analysis using Groq LLM"""
+    """Handles AI-powered analysis using the OpenAI LLM"""
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(__name__)
         self.llm_util = AIConfig()
         self.prompt_creator = PromptCreator()
     
    
     
-    def get_llm_analysis(
+    async def get_llm_analysis(
         self, 
         text: str, 
         target_role: str, 
@@ -31,35 +33,119 @@ class AIAnalyzer:
             text (str): Resume text
             target_role (str): Target job role
             job_description (str): Job description (optional)
-            matched_skills (Optional[List[str]]): Skills that match job requirements
-            missing_skills (Optional[List[str]]): Skills missing from resume
             
         Returns:
-            str: AI-generated analysis and recommendations
+            Dict[str, Any]: AI-generated analysis and recommendations
         """
         try:
-
-            
-            # Create comprehensive prompt
             system_prompt, user_prompt = self.prompt_creator._create_analysis_prompt(
                 text, target_role, job_description
             )
+            analysis = await self.llm_util.chat_with_openai(system_prompt, user_prompt, use_cache=True, json_mode=True)
+            self.logger.info("Successfully generated LLM analysis")
             
-            
-            analysis = self.llm_util.chat_with_openai(system_prompt, user_prompt)
-            
-            logger.info("Successfully generated LLM analysis")
-            
-            logger.info("Converting llm analysis to proper format")
-            response = ResumeDetailsExtractor.parse_resume_with_json_extraction(response_text=analysis)
-            
-            return response
+            return ResumeDetailsExtractor.parse_resume_with_json_extraction(analysis)
             
         except Exception as e:
-            logger.error(f"Error getting LLM analysis: {e}")
+            self.logger.error(f"Error getting LLM analysis: {e}")
             return f"Error generating analysis: {str(e)}"
     
-    def get_mcq_for_skill_assessment(self, soft_skills: str, technical_skills: str) -> Dict[str, Any] | None:
+    async def stream_llm_analysis(
+        self, 
+        text: str, 
+        target_role: str, 
+        job_description: str = ""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream comprehensive LLM analysis of resume, giving every list entry of the analysis as soon as
+        it is generated and the complete analysis at the end
+        
+        Args:
+            text (str): Resume text
+            target_role (str): Target job role
+            job_description (str): Job description (optional)
+            
+        Yields:
+            Dict[str, Any]: `item` events with the list name and the entry, then one `analysis` event with the complete analysis
+        """
+        system_prompt, user_prompt = self.prompt_creator._create_analysis_prompt(
+            text, target_role, job_description
+        )
+        
+        parser = JSONArrayItemStreamParser()
+        async for chunk in self.llm_util.stream_chat_with_openai(system_prompt, user_prompt, json_mode=True):
+            for key, item in parser.feed(chunk):
+                yield {"event": "item", "key": key, "item": item}
+        
+        self.logger.info("Successfully streamed LLM analysis")
+        yield {
+            "event": "analysis",
+            "analysis": ResumeDetailsExtractor.parse_resume_with_json_extraction(parser.text())
+        }
+    
+    async def batch_complete(
+        self, 
+        prompts: List[Tuple[str, str]], 
+        use_cache: bool = True, 
+        max_tokens: int = 4096,
+        json_mode: bool = False
+    ) -> List[str | None]:
+        """Submit several independent prompts together and return their responses in order
+        
+        The requests share the pooled client and are bounded by the client's concurrency limit,
+        so the batch costs roughly one LLM round trip instead of one per prompt.
+
+        Args:
+            prompts (List[Tuple[str, str]]): List of (system_prompt, user_prompt) pairs
+            use_cache (bool): Serve identical prompts from the response cache
+            max_tokens (int): Upper bound on generated tokens of every response
+            json_mode (bool): Constrain every response to a single valid JSON object
+
+        Returns:
+            List[str | None]: Response text for every prompt, None where the call failed
+        """
+        return await asyncio.gather(*(
+            self.llm_util.chat_with_openai(system_prompt, user_prompt, use_cache=use_cache, max_tokens=max_tokens, json_mode=json_mode)
+            for system_prompt, user_prompt in prompts
+        ))
+    
+    async def get_batched_resume_analysis(
+        self,
+        text: str,
+        target_role: str,
+        job_description: str = "",
+        parser_text: Optional[str] = None
+    ) -> Tuple[Any, Any, Any, Any]:
+        """Get resume details, overall analysis, ATS score and section wise analysis in one batch
+
+        Args:
+            text (str): Resume text for the analysis and scoring prompts
+            target_role (str): Target job role
+            job_description (str): Job description (optional)
+            parser_text (Optional[str]): Resume text for the resume parser prompt, defaults to `text`
+
+        Returns:
+            Tuple[Any, Any, Any, Any]: Parsed resume details, overall analysis, ATS score and section wise analysis
+        """
+        prompts = [
+            self.prompt_creator._create_resume_parser_prompt(parser_text or text),
+            self.prompt_creator._create_analysis_prompt(text, target_role, job_description),
+            self.prompt_creator._create_section_prompt(text, target_role, job_description),
+        ]
+        # Scoring uses its own deterministic settings, so it runs alongside the batch
+        responses, ats_score = await asyncio.gather(
+            self.batch_complete(prompts, json_mode=True),
+            self.compute_resume_score(text, target_role, job_description)
+        )
+        self.logger.info("Successfully generated batched LLM analysis")
+        
+        resume_details, overall_analysis, section_analysis = (
+            ResumeDetailsExtractor.parse_resume_with_json_extraction(response)
+            for response in responses
+        )
+        return resume_details, overall_analysis, ats_score, section_analysis
+    
+    async def get_mcq_for_skill_assessment(self, soft_skills: str, technical_skills: str) -> Dict[str, Any] | None:
         """Method to get MCQ questions based on provided soft skills and technical skills 
 
         Args:
@@ -75,20 +161,20 @@ class AIAnalyzer:
     
         try:
             system_prompt, user_prompt = self.prompt_creator._create_skill_assessment_prompt(technical_skills=technical_skills, soft_skills=soft_skills)
-            response = self.llm_util.chat_with_openai(system_prompt, user_prompt)
+            response = await self.llm_util.chat_with_openai(system_prompt, user_prompt, json_mode=True, model=ResumeAnalyzerConfig.FAST_MODEL)
             
             return ResumeDetailsExtractor.parse_resume_with_json_extraction(response)
         except Exception as e:
-            logger.error(f"Failed to generate mcq's from llm, error: {str(e)}")
+            self.logger.error(f"Failed to generate mcq's from llm, error: {str(e)}")
             raise e
   
-    def get_section_wise_analysis(
+    async def get_section_wise_analysis(
         self,
         text: str,
         target_role: str,
         job_description: str
     ) -> Dict[str, Any]:
-        """_summary_
+        """Get section wise analysis of the resume
 
         Args:
             text (str): extracted resume text
@@ -98,21 +184,21 @@ class AIAnalyzer:
         Returns:
             Dict[str, Any]: dictionary with section wise analysis
         """
-        try:        
+        try:
             system_prompt, user_prompt = self.prompt_creator._create_section_prompt(
                 text, target_role, job_description
             )
-            analysis = self.llm_util.chat_with_openai(system_prompt, user_prompt)
-            logger.info("Successfully generated LLM analysis")
+            analysis = await self.llm_util.chat_with_openai(system_prompt, user_prompt, use_cache=True, json_mode=True)
+            self.logger.info("Successfully generated LLM analysis")
             
             return ResumeDetailsExtractor.parse_resume_with_json_extraction(analysis)
             
         except Exception as e:
-            logger.info(f"Error getting LLM analysis: {str(e)}")
+            self.logger.error(f"Error getting section wise LLM analysis: {str(e)}")
             raise e
     
     
-    def get_resume_details(self, text: str) -> Optional[Dict[str, any]]:
+    async def get_resume_details(self, text: str) -> Optional[Dict[str, any]]:
         '''Method to extract the details of the resume in structured manner from reume
         
         Args:
@@ -122,19 +208,19 @@ class AIAnalyzer:
             dict: Python object with resume details 
         '''
         try:
-            logger.info("Sent the text to LLM for getting structured output of the resume")
+            self.logger.info("Sent the text to LLM for getting structured output of the resume")
             
             system_prompt, user_prompt = self.prompt_creator._create_resume_parser_prompt(text)
-            analysis = self.llm_util.chat_with_openai(system_prompt, user_prompt)
+            analysis = await self.llm_util.chat_with_openai(system_prompt, user_prompt, use_cache=True, json_mode=True)
         
             # extracted_json = self.extract_json_from_response(analysis)
             return ResumeDetailsExtractor.parse_resume_with_json_extraction(analysis)
         except Exception as e:
-            logger.error(f"Error getting resume details from llm: {str(e)}")
+            self.logger.error(f"Error getting resume details from llm: {str(e)}")
             return None
         
         
-    def get_career_suggestions_based_on_score(self, skill_scores: List, overall_score: float) -> Dict[str, Any]:
+    async def get_career_suggestions_based_on_score(self, skill_scores: List, overall_score: float) -> Dict[str, Any]:
         """Method to generate possible job role on the basis of the score and also strength and weakness
 
         Args:
@@ -150,14 +236,14 @@ class AIAnalyzer:
         try:
             system_prompt, user_prompt = self.prompt_creator._create_career_suggestion_prompt(skill_scores=skill_scores, overall_score=overall_score)
             
-            response = self.llm_util.chat_with_openai(system_prompt, user_prompt)            
+            response = await self.llm_util.chat_with_openai(system_prompt, user_prompt, use_cache=True, max_tokens=ResumeAnalyzerConfig.CAREER_SUGGESTION_MAX_TOKENS, json_mode=True)
             return ResumeDetailsExtractor.parse_resume_with_json_extraction(response)
         except Exception as e:
-            logger.error(f"Failed to generate career suggestions, {str(e)}")
+            self.logger.error(f"Failed to generate career suggestions, {str(e)}")
             raise e  
 
 
-    def compute_resume_score(self, text: str, target_role: str, job_description: str = "") -> int:
+    async def compute_resume_score(self, text: str, target_role: str, job_description: str = "") -> Dict[str, Any]:
         """
         Compute overall resume score using AI
         
@@ -167,20 +253,26 @@ class AIAnalyzer:
             job_description (str): Job description (optional)
             
         Returns:
-            int: Resume score (0-100)
+            Dict[str, Any]: ATS score, format compliance, keyword optimization and readability scores
         """
         try:
-      
             # Create scoring prompt
             system_prompt, user_prompt = self.prompt_creator._create_scoring_prompt(text, target_role, job_description)
             
-           
-            
-            score_text = self.llm_util.chat_with_openai(system_prompt, user_prompt)
+            # Scores are a small JSON object, so answer deterministically with a tight token budget
+            score_text = await self.llm_util.chat_with_openai(
+                system_prompt, 
+                user_prompt, 
+                use_cache=True,
+                max_tokens=ResumeAnalyzerConfig.SCORE_MAX_TOKENS,
+                temperature=0,
+                json_mode=True,
+                model=ResumeAnalyzerConfig.FAST_MODEL
+            )
             
             return ResumeDetailsExtractor.parse_resume_with_json_extraction(score_text)
         except Exception as e:
-            logger.error(f"Error computing resume score: {e}")
+            self.logger.error(f"Error computing resume score: {e}")
             return {
                 'ats_score': None,
                 'format_compliance': 0,
@@ -188,7 +280,7 @@ class AIAnalyzer:
                 'readability': 0    
             }
         
-    def improve_section_with_ai(
+    async def improve_section_with_ai(
         self, 
         section_text: str, 
         section_name: str, 
@@ -215,16 +307,16 @@ class AIAnalyzer:
             )
            
             
-            improved_content = self.llm_util.chat_with_openai(system_prompt, user_prompt)
-            logger.info(f"Successfully improved {section_name} section")
+            improved_content = await self.llm_util.chat_with_openai(system_prompt, user_prompt, max_tokens=ResumeAnalyzerConfig.SECTION_IMPROVEMENT_MAX_TOKENS)
+            self.logger.info(f"Successfully improved {section_name} section")
             
             return improved_content
             
         except Exception as e:
-            logger.error(f"Error improving section: {e}")
+            self.logger.error(f"Error improving section: {e}")
             return f"Error improving section: {str(e)}"
     
-    def generate_ai_resume(
+    async def generate_ai_resume(
         self, 
         sections: Dict[str, List[str]], 
         target_role: str, 
@@ -251,17 +343,41 @@ class AIAnalyzer:
             
        
             
-            generated_resume = self.llm_util.chat_with_openai(system_prompt, user_prompt)
-            logger.info("Successfully generated AI-optimized resume")
+            generated_resume = await self.llm_util.chat_with_openai(system_prompt, user_prompt)
+            self.logger.info("Successfully generated AI-optimized resume")
             
             return generated_resume
             
         except Exception as e:
-            logger.error(f"Error generating AI resume: {e}")
+            self.logger.error(f"Error generating AI resume: {e}")
             return f"Error generating resume: {str(e)}"
     
     
-    def generate_project_section_description(
+    async def stream_ai_resume(
+        self, 
+        sections: Dict[str, List[str]], 
+        target_role: str, 
+        job_description: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Stream complete AI-optimized resume while it is being generated
+        
+        Args:
+            sections (Dict[str, List[str]]): Extracted resume sections
+            target_role (str): Target job role
+            job_description (str): Job description (optional)
+            
+        Yields:
+            str: Chunks of the AI-generated resume
+        """
+        sections_summary = self._prepare_sections_summary(sections)
+        system_prompt, user_prompt = self.prompt_creator._create_generation_prompt(sections_summary, target_role, job_description)
+        
+        async for chunk in self.llm_util.stream_chat_with_openai(system_prompt, user_prompt):
+            yield chunk
+        self.logger.info("Successfully streamed AI-optimized resume")
+    
+    async def generate_project_section_description(
         self,
         project_name: str,
         tech_stack: str,
@@ -282,13 +398,13 @@ class AIAnalyzer:
         """
         try:
             system_prompt, user_prompt = self.prompt_creator._create_project_section_prompt(project_name, tech_stack, bullet_points)
-            response = self.llm_util.chat_with_openai(system_prompt, user_prompt)
+            response = await self.llm_util.chat_with_openai(system_prompt, user_prompt, max_tokens=ResumeAnalyzerConfig.DESCRIPTION_MAX_TOKENS, model=ResumeAnalyzerConfig.FAST_MODEL)
             return response
         except Exception as e:
-            logger.error(f"Failed to generate project section description, error: {str(e)}")
+            self.logger.error(f"Failed to generate project section description, error: {str(e)}")
             raise e
         
-    def generate_experience_section_description(
+    async def generate_experience_section_description(
         self,
         organisation_name: str, 
         position: str, 
@@ -311,13 +427,13 @@ class AIAnalyzer:
         """
         try:
             system_prompt, user_prompt = self.prompt_creator._create_experience_section_prompt(organisation_name, position, location, bullet_points)
-            response = self.llm_util.chat_with_openai(system_prompt, user_prompt)
+            response = await self.llm_util.chat_with_openai(system_prompt, user_prompt, max_tokens=ResumeAnalyzerConfig.DESCRIPTION_MAX_TOKENS, model=ResumeAnalyzerConfig.FAST_MODEL)
             return response
         except Exception as e:
-            logger.error(f"Failed to generate experience section description, error: {str(e)}")
+            self.logger.error(f"Failed to generate experience section description, error: {str(e)}")
             raise e
    
-    def get_ats_score(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_ats_score(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
         """Comprehensive analysis of resume to get ats score
 
         Args:
@@ -331,13 +447,13 @@ class AIAnalyzer:
         """
         try:
             system_prompt, user_prompt = self.prompt_creator._create_ats_prompt(resume_data)
-            response = self.llm_util.chat_with_openai(system_prompt, user_prompt)
+            response = await self.llm_util.chat_with_openai(system_prompt, user_prompt, use_cache=True, json_mode=True)
             return ResumeDetailsExtractor.parse_resume_with_json_extraction(response)
         except Exception as e:
-            logger.error(f"Failed to get ATS score in ai_analyzer module, error: {str(e)}")
+            self.logger.error(f"Failed to get ATS score in ai_analyzer module, error: {str(e)}")
             raise e
             
-    def generate_extracurricular_section_description(
+    async def generate_extracurricular_section_description(
         self,
         organisation_name: str, 
         position: str, 
@@ -360,16 +476,16 @@ class AIAnalyzer:
         """
         try:
             system_prompt, user_prompt = self.prompt_creator._create_extracurricular_section_prompt(organisation_name, position, location, bullet_points)
-            response = self.llm_util.chat_with_openai(system_prompt, user_prompt)
+            response = await self.llm_util.chat_with_openai(system_prompt, user_prompt, max_tokens=ResumeAnalyzerConfig.DESCRIPTION_MAX_TOKENS, model=ResumeAnalyzerConfig.FAST_MODEL)
             return response
         except Exception as e:
-            logger.error(f"Failed to generate experience section description, error: {str(e)}")
+            self.logger.error(f"Failed to generate experience section description, error: {str(e)}")
             raise e
         
     def _prepare_sections_summary(self, sections: Dict[str, List[str]]) -> str:
-        """Prepare a summary of resume sections for AI processing"""
-        sections_text = ""
-        for section, content in sections.items():
-            if content:
-                sections_text += f"{section.title()}: {'; '.join(content[:3])}\n"
-        return sections_text
\ No newline at end of file
+        """Prepare a summary of resume sections for AI processing, using the first three lines of each section"""
+        return "".join(
+            f"{section.title()}: {'; '.join(content[:3])}\n"
+            for section, content in sections.items()
+            if content
+        )
\ No newline at end of file
@@ -1,60 +1,326 @@
-import logging
-from openai import AzureOpenAI
+import logging, asyncio, hashlib, time
+import httpx, openai
+from collections import OrderedDict
+from typing import Optional, Tuple, List, Dict, Any, AsyncIterator
+from fastapi import HTTPException, status
+from openai import AsyncAzureOpenAI, NOT_GIVEN
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from features.resume.config import ResumeAnalyzerConfig
 logger = logging.getLogger(__name__)
 
+# Transient provider errors worth retrying, anything else fails fast
+RETRYABLE_LLM_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes timeouts
+    openai.InternalServerError,
+)
+
+# Jittered, so requests rate limited together do not all retry at the same moment
+_backoff_wait = wait_random_exponential(multiplier=0.5, max=ResumeAnalyzerConfig.LLM_MAX_RETRY_WAIT_SECONDS)
+
+def _retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read how long the provider asked to wait before retrying, from the error response headers"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    
+    retry_after_ms = response.headers.get("retry-after-ms")
+    retry_after = response.headers.get("retry-after")
+    try:
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000
+        if retry_after is not None:
+            return float(retry_after)
+    except ValueError:
+        # Retry-After can also be an HTTP date, fall back to backoff for that
+        pass
+    return None
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    """Wait as long as the provider asks for when it says so, jittered exponential backoff otherwise"""
+    retry_after = _retry_after_seconds(retry_state.outcome.exception())
+    if retry_after is not None:
+        return min(retry_after, ResumeAnalyzerConfig.LLM_MAX_RETRY_WAIT_SECONDS)
+    return _backoff_wait(retry_state)
+
+def _retrying() -> AsyncRetrying:
+    """Retry policy of every request to the LLM endpoint, the client itself does not retry"""
+    return AsyncRetrying(
+        retry=retry_if_exception_type(RETRYABLE_LLM_ERRORS),
+        wait=_wait_before_retry,
+        stop=stop_after_attempt(ResumeAnalyzerConfig.LLM_MAX_RETRY_ATTEMPTS),
+        reraise=True
+    )
+
+
+class LLMResponseCache:
+    """In-process exact match cache with TTL expiry and LRU eviction, for LLM responses and idempotent request results"""
+    
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Hash all request parameters into a fixed size cache key, bytes are hashed as they are"""
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            hasher.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
 class AIConfig:
     def __init__(self):
+        # One pooled HTTP/2 client, so concurrent requests reuse open connections to the LLM endpoint
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(ResumeAnalyzerConfig.LLM_TIMEOUT_SECONDS, connect=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=ResumeAnalyzerConfig.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=ResumeAnalyzerConfig.LLM_MAX_CONNECTIONS
+            )
+        )
         self.openai_client = self.__initialise_openai_client()
+        # Bounds in-flight LLM requests per process to respect provider rate limits
+        self.request_semaphore = asyncio.Semaphore(ResumeAnalyzerConfig.LLM_MAX_CONCURRENT_REQUESTS)
+        self.response_cache = LLMResponseCache(
+            max_entries=ResumeAnalyzerConfig.LLM_CACHE_MAX_ENTRIES,
+            ttl_seconds=ResumeAnalyzerConfig.LLM_CACHE_TTL_SECONDS
+        )
+        # Identical cacheable requests already in flight, later callers await the same task
+        self._inflight_requests: Dict[str, asyncio.Task] = {}
         
     def __initialise_openai_client(self):
         try:
-            return AzureOpenAI(
-                azure_deployment=ResumeAnalyzerConfig.OPENAI_MODEL,
+            # No fixed deployment, every request is routed to the deployment named by its model
+            return AsyncAzureOpenAI(
                 api_key=ResumeAnalyzerConfig.OPENAI_API_KEY,
                 api_version="2025-01-01-preview",
-                azure_endpoint=ResumeAnalyzerConfig.OPENAI_ENDPOINT
+                azure_endpoint=ResumeAnalyzerConfig.OPENAI_ENDPOINT,
+                http_client=self.http_client,
+                # Retries are handled by _retrying around every request
+                max_retries=0
             )
         except Exception as e:
             logger.error(f"Failed to initialize openai client, error: {str(e)}")
             
-    def chat_with_openai(self, system_prompt: str, user_prompt) -> str | None:
+    async def warmup(self) -> None:
+        """Open a pooled connection to the LLM endpoint, so the first real request skips connection setup"""
         try:
-            # Prepare the chat prompt
-            chat_prompt = [
-                {
-                    "role": "system",
-                    "content": [
-                        # {"type": "text", "text": "You are an AI assistant that helps people find information."}
-                        {"type": "text", "text": system_prompt}
-                    ]
-                },
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": user_prompt}
-                    ]
-                },
-                {
-                    "role": "assistant",
-                    "content": [
-                        {"type": "text", "text": "Hello! How can I help you today?"}
-                    ]
-                }
-            ]
+            await asyncio.wait_for(
+                self.openai_client.chat.completions.create(
+                    model=ResumeAnalyzerConfig.ANALYSIS_MODEL,
+                    messages=[{"role": "user", "content": "ping"}],
+                    max_tokens=1
+                ),
+                timeout=10.0
+            )
+            logger.info("LLM client warmed up")
+        except Exception as e:
+            logger.warning(f"Failed to warm up LLM client, error: {str(e)}")
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP client"""
+        await self.http_client.aclose()
+            
+    @staticmethod
+    def _build_chat_prompt(system_prompt: str, user_prompt: str) -> List[Dict[str, Any]]:
+        """Prepare the chat messages for the given prompts"""
+        return [
+            {
+                "role": "system",
+                "content": [
+                    # {"type": "text", "text": "You are an AI assistant that helps people find information."}
+                    {"type": "text", "text": system_prompt}
+                ]
+            },
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": user_prompt}
+                ]
+            },
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": "Hello! How can I help you today?"}
+                ]
+            }
+        ]
             
-            response = self.openai_client.chat.completions.create(
-                model=ResumeAnalyzerConfig.MODEL,
-                messages=chat_prompt,
-                # max_tokens=100,
-                max_tokens=4096,  # uncomment this in deployment
-                temperature=1,
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0,
-                stream=False
+    async def chat_with_openai(
+        self, 
+        system_prompt: str, 
+        user_prompt, 
+        use_cache: bool = False,
+        max_tokens: int = 4096,
+        temperature: float = 1,
+        json_mode: bool = False,
+        *,
+        model: Optional[str] = None
+    ) -> str | None:
+        """Send the prompts to the LLM and return the response text
+        
+        Args:
+            system_prompt (str): System prompt
+            user_prompt (str): User prompt
+            use_cache (bool): Serve identical prompts from the response cache and share identical
+                in-flight requests. Only for analysis style calls, generation calls are expected to
+                give a fresh answer every time.
+            max_tokens (int): Upper bound on generated tokens
+            temperature (float): Sampling temperature, 0 for deterministic answers
+            json_mode (bool): Constrain the response to a single valid JSON object
+            model (Optional[str]): Deployment to use, defaults to the analysis model
+        
+        Returns:
+            str | None: Response text or None if the LLM call failed
+        """
+        model = model or ResumeAnalyzerConfig.ANALYSIS_MODEL
+        if use_cache:
+            cache_key = LLMResponseCache.make_key(
+                model, system_prompt, user_prompt, max_tokens, temperature, json_mode
+            )
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                logger.info("Serving LLM response from cache")
+                return cached_response
+            
+            inflight_request = self._inflight_requests.get(cache_key)
+            if inflight_request is None:
+                inflight_request = asyncio.ensure_future(self._create_chat_completion(
+                    system_prompt, user_prompt, max_tokens, temperature, json_mode, model, cache_key
+                ))
+                self._inflight_requests[cache_key] = inflight_request
+                inflight_request.add_done_callback(
+                    lambda _: self._inflight_requests.pop(cache_key, None)
+                )
+            else:
+                logger.info("Joining identical in-flight LLM request")
+            # Shielded so one caller going away does not cancel the request for the others
+            return await asyncio.shield(inflight_request)
+        
+        return await self._create_chat_completion(system_prompt, user_prompt, max_tokens, temperature, json_mode, model)
+    
+    async def _create_chat_completion(
+        self, 
+        system_prompt: str, 
+        user_prompt: str, 
+        max_tokens: int, 
+        temperature: float, 
+        json_mode: bool,
+        model: str,
+        cache_key: Optional[str] = None
+    ) -> str | None:
+        """Issue the chat completion request, storing the response under cache_key when given
+        
+        Rate limits, timeouts and provider side failures are retried, waiting as long as the provider's
+        retry-after header asks or with jittered exponential backoff, and give None once the attempts
+        run out. Requests the provider rejects (authentication, invalid request) are not retried and
+        raise an HTTPException.
+        """
+        try:
+            chat_prompt = self._build_chat_prompt(system_prompt, user_prompt)
+            
+            async for attempt in _retrying():
+                with attempt:
+                    async with self.request_semaphore:
+                        response = await self.openai_client.chat.completions.create(
+                            model=model,
+                            messages=chat_prompt,
+                            # max_tokens=100,
+                            max_tokens=max_tokens,  # uncomment this in deployment
+                            temperature=temperature,
+                            top_p=1,
+                            frequency_penalty=0,
+                            presence_penalty=0,
+                            response_format={"type": "json_object"} if json_mode else NOT_GIVEN,
+                            stream=False
+                        )
+            content = response.choices[0].message.content
+            if cache_key is not None and content:
+                self.response_cache.set(cache_key, content)
+            return content
+        except RETRYABLE_LLM_ERRORS as e:
+            logger.error(f"LLM request failed after {ResumeAnalyzerConfig.LLM_MAX_RETRY_ATTEMPTS} attempts, error: {str(e)}")
+            return None
+        except openai.APIStatusError as e:
+            logger.error(f"LLM request rejected with status {e.status_code}, error: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="LLM provider rejected the request"
             )
-            return response.choices[0].message.content
         except Exception as e:
             logger.error(f"Failed to get output from openai, error: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+            
+    async def stream_chat_with_openai(
+        self, 
+        system_prompt: str, 
+        user_prompt: str, 
+        max_tokens: int = 4096,
+        json_mode: bool = False
+    ) -> AsyncIterator[str]:
+        """Send the prompts to the LLM and yield the response text as it is generated
+        
+        Opening the stream is retried like non streaming requests, a stream failing midway is not
+        since part of the response has already been yielded.
+        
+        Args:
+            system_prompt (str): System prompt
+            user_prompt (str): User prompt
+            max_tokens (int): Upper bound on generated tokens
+            json_mode (bool): Constrain the response to a single valid JSON object
+        
+        Yields:
+            str: Chunks of the response text
+        """
+        chat_prompt = self._build_chat_prompt(system_prompt, user_prompt)
+        
+        # The slot is taken inside each attempt, so backoff sleeps don't hold it, and kept until the stream is consumed
+        async for attempt in _retrying():
+            with attempt:
+                await self.request_semaphore.acquire()
+                try:
+                    stream = await self.openai_client.chat.completions.create(
+                        model=ResumeAnalyzerConfig.ANALYSIS_MODEL,
+                        messages=chat_prompt,
+                        max_tokens=max_tokens,
+                        temperature=1,
+                        top_p=1,
+                        frequency_penalty=0,
+                        presence_penalty=0,
+                        response_format={"type": "json_object"} if json_mode else NOT_GIVEN,
+                        stream=True
+                    )
+                except BaseException:
+                    self.request_semaphore.release()
+                    raise
+        try:
+            async with stream:
+                async for chunk in stream:
+                    # Azure sends content filter results as chunks without choices
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        finally:
+            self.request_semaphore.release()
@@ -4,6 +4,13 @@ from sklearn.metrics.pairwise import cosine_similarity
 
 logger = logging.getLogger(__name__)
 
+# TF-IDF settings, a new vectorizer is fitted per comparison since calls run concurrently in threads
+TFIDF_VECTORIZER_PARAMS = {
+    "stop_words": "english",
+    "max_features": 1000,  # Limit features for efficiency
+    "ngram_range": (1, 2)  # Include bigrams
+}
+
 class JobMatchCalculator:
     """Calculates job matching scores using various algorithms"""
     
@@ -26,18 +33,11 @@ class JobMatchCalculator:
             if not job_description:
                 return 0.0
             
-            # Create TF-IDF vectors
-            vectorizer = TfidfVectorizer(
-                stop_words='english',
-                max_features=1000,  # Limit features for efficiency
-                ngram_range=(1, 2)  # Include bigrams
-            )
-            
             # Fit and transform documents
-            tfidf_matrix = vectorizer.fit_transform([resume_text, job_description])
+            tfidf_matrix = TfidfVectorizer(**TFIDF_VECTORIZER_PARAMS).fit_transform([resume_text, job_description])
             
             # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            similarity = float(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0])
             similarity_percentage = round(similarity * 100, 2)
             
             logger.info(f"Calculated cosine similarity score: {similarity_percentage}%")
@@ -0,0 +1,102 @@
+"""
+Module which parses a JSON object incrementally while an LLM response is being streamed
+"""
+import logging
+import orjson
+from typing import Any, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class JSONArrayItemStreamParser:
+    """Scans a streamed JSON object and gives every element of its top level arrays as soon as the element is complete
+
+    Only object and string elements are reported, which covers every list in the analysis schema. The complete
+    response is kept as well, so the whole object can still be parsed once the stream ends.
+    """
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        # Characters of the string currently read at the top level, the candidate key
+        self._key_chars: Optional[List[str]] = None
+        self._last_key: Optional[str] = None
+        # Key of the top level array currently being read
+        self._array_key: Optional[str] = None
+        # Parts of the array element currently being read
+        self._item_parts: Optional[List[str]] = None
+
+    def feed(self, chunk: str) -> Iterator[Tuple[str, Any]]:
+        """Consume the next chunk of the response
+
+        Args:
+            chunk (str): Next piece of the streamed response text
+
+        Yields:
+            Tuple[str, Any]: Key of the top level array and the parsed element, for every element completed in this chunk
+        """
+        self._chunks.append(chunk)
+        item_from = 0
+
+        for index, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._item_parts is not None and self._depth == 2:
+                        # End of a string element
+                        item = self._finish_item(chunk[item_from:index + 1])
+                        if item is not None:
+                            yield item
+                    continue
+
+                if self._key_chars is not None:
+                    self._key_chars.append(char)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._key_chars = []
+                elif self._depth == 2 and self._array_key is not None and self._item_parts is None:
+                    self._item_parts, item_from = [], index
+            elif char in "{[":
+                if self._depth == 2 and self._array_key is not None and self._item_parts is None:
+                    self._item_parts, item_from = [], index
+                self._depth += 1
+                if char == "[" and self._depth == 2:
+                    self._array_key = self._last_key
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 2 and self._item_parts is not None:
+                    item = self._finish_item(chunk[item_from:index + 1])
+                    if item is not None:
+                        yield item
+                elif self._depth == 1:
+                    self._array_key = None
+            elif char == ":" and self._depth == 1 and self._key_chars is not None:
+                self._last_key = "".join(self._key_chars)
+                self._key_chars = None
+
+        if self._item_parts is not None:
+            self._item_parts.append(chunk[item_from:])
+
+    def _finish_item(self, last_part: str) -> Optional[Tuple[str, Any]]:
+        """Parse the element that just completed, None if it is not valid JSON"""
+        self._item_parts.append(last_part)
+        item_text = "".join(self._item_parts)
+        self._item_parts = None
+        try:
+            return self._array_key, orjson.loads(item_text)
+        except orjson.JSONDecodeError as e:
+            # The element is skipped, the complete response is still parsed once the stream ends
+            logger.warning(f"Failed to parse streamed {self._array_key} element, error: {str(e)}")
+            return None
+
+    def text(self) -> str:
+        """Complete response text received so far"""
+        return "".join(self._chunks)
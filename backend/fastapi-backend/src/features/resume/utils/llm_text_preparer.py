@@ -0,0 +1,83 @@
+import logging, re
+from functools import lru_cache
+from typing import Optional
+import tiktoken
+from features.resume.config import ResumeAnalyzerConfig
+
+logger = logging.getLogger(__name__)
+
+# Whitespace and boilerplate patterns, compiled once
+HORIZONTAL_SPACE_PATTERN = re.compile(r"[ \t\f\v\u00a0]+")
+BLANK_LINES_PATTERN = re.compile(r"\n\s*\n+")
+BASE64_BLOB_PATTERN = re.compile(r"[A-Za-z0-9+/]{100,}={0,2}")
+ZERO_WIDTH_PATTERN = re.compile(r"[\u200b-\u200d\u2060\ufeff\u00ad]")
+BULLET_PATTERN = re.compile(r"[\u2022\u25cf\u25aa\u25a0\u25e6\u2023\u2219\u27a2\uf0b7]")
+PAGE_NUMBER_PATTERN = re.compile(r"^[ \t]*(?:[Pp][Aa][Gg][Ee][ \t]+)?\d+[ \t]+(?:[Oo][Ff]|/)[ \t]+\d+[ \t]*$|^[ \t]*[Pp][Aa][Gg][Ee][ \t]+\d+[ \t]*$", re.MULTILINE)
+TRAILING_SPACE_PATTERN = re.compile(r" +\n")
+
+# Rough characters per token, used only when the tokenizer is unavailable
+APPROX_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def get_tokenizer() -> Optional[tiktoken.Encoding]:
+    """Load the tokenizer for the configured model once per process"""
+    try:
+        return tiktoken.get_encoding(ResumeAnalyzerConfig.TOKENIZER_ENCODING)
+    except Exception as e:
+        logger.warning(f"Failed to load tokenizer, falling back to character based limits, error: {str(e)}")
+        return None
+
+
+class LLMTextPreparer:
+    """Compacts and token-limits text before it is sent to the LLM"""
+    
+    def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate text to at most `max_tokens` tokens
+        
+        Args:
+            text (str): Text to truncate
+            max_tokens (int): Token budget
+            
+        Returns:
+            str: Text within the token budget
+        """
+        tokenizer = get_tokenizer()
+        if tokenizer is None:
+            return text[:max_tokens * APPROX_CHARS_PER_TOKEN]
+        
+        tokens = tokenizer.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        
+        logger.info(f"Truncating LLM input from {len(tokens)} to {max_tokens} tokens")
+        return tokenizer.decode(tokens[:max_tokens])
+    
+    def prepare_llm_text(self, text: str, max_tokens: int = ResumeAnalyzerConfig.MAX_LLM_INPUT_TOKENS) -> str:
+        """
+        Compact resume text and limit it to a token budget before sending it to the LLM
+        
+        Drops invisible characters, page number lines and inline data blobs, turns bullet glyphs into
+        dashes and collapses whitespace. Line breaks are kept since they carry the section layout, and
+        URLs are kept because the resume parser extracts social and project links from them.
+        
+        Args:
+            text (str): Extracted resume text
+            max_tokens (int): Token budget for the text
+            
+        Returns:
+            str: Compacted text within the token budget
+        """
+        if not text:
+            return ""
+        
+        text = BASE64_BLOB_PATTERN.sub("", text)
+        text = ZERO_WIDTH_PATTERN.sub("", text)
+        text = PAGE_NUMBER_PATTERN.sub("", text)
+        text = BULLET_PATTERN.sub("-", text)
+        text = HORIZONTAL_SPACE_PATTERN.sub(" ", text)
+        text = TRAILING_SPACE_PATTERN.sub("\n", text)
+        text = BLANK_LINES_PATTERN.sub("\n\n", text)
+        
+        return self.truncate_to_tokens(text.strip(), max_tokens)
@@ -7,52 +7,112 @@ import cv2, spacy
 from pdf2image import convert_from_path
 from features.resume.config import ResumeAnalyzerConfig
 from typing import Dict, Any, Optional
-from transformers import pipeline
+from spacy.tokens import Doc
+from spacy.language import Language
+from transformers import pipeline, Pipeline
+from functools import lru_cache
 import re
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def load_spacy_model() -> Optional[Language]:
+    """Load the spaCy model once per process, on first use"""
+    try:
+        try:
+            # Lemmas are never used, skip the lemmatizer
+            nlp_model = spacy.load("en_core_web_sm", exclude=["lemmatizer"])
+        except OSError:
+            from spacy.cli import download
+            download("en_core_web_sm")
+            nlp_model = spacy.load("en_core_web_sm", exclude=["lemmatizer"])
+            
+        logger.info("spaCy model loaded successfully")
+        return nlp_model
+    except Exception as e:
+        logger.error(f"Error initializing spaCy model: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def load_zero_shot_classifier() -> Optional[Pipeline]:
+    """Load the zero-shot classification model once per process, on first use"""
+    try:
+        classifier = pipeline(
+            "zero-shot-classification", 
+            model="facebook/bart-large-mnli"
+        )
+        logger.info("Zero-shot classifier loaded successfully")
+        return classifier
+    except Exception as e:
+        logger.error(f"Error initializing zero-shot classifier: {e}")
+        return None
+
+
 class NLPAnalyzer:
-    """Handles Natural Language Processing tasks for resume analysis"""
+    """Handles Natural Language Processing tasks for resume analysis
+    
+    Models are loaded lazily on first use and shared by every instance in the process.
+    """
     
     def __init__(self, logger: logging.Logger):
         # self.logger = logger
-        self.nlp_model = None
-        self.classifier = None
-        self._initialize_models()
+        pass
     
-    def _initialize_models(self) -> None:
-        """Initialize NLP models and classifiers"""
-        try:
-            # Load spaCy model for NLP processing
-            try:
-                self.nlp_model = spacy.load("en_core_web_sm")
-            except OSError:
-                from spacy.cli import download
-                download("en_core_web_sm")
-                self.nlp_model = spacy.load("en_core_web_sm")
-                
-            logger.info("spaCy model loaded successfully")
-            # Load zero-shot classification model
-            self.classifier = pipeline(
-                "zero-shot-classification", 
-                model="facebook/bart-large-mnli"
-            )
-            logger.info("Zero-shot classifier loaded successfully")
+    @property
+    def nlp_model(self) -> Optional[Language]:
+        """spaCy model, loaded on first access"""
+        return load_spacy_model()
+    
+    @property
+    def classifier(self) -> Optional[Pipeline]:
+        """Zero-shot classifier, loaded on first access"""
+        return load_zero_shot_classifier()
+    
+    @staticmethod
+    def get_model_status() -> Dict[str, str]:
+        """
+        Status of the spaCy model and the classifier, without loading the ones not loaded yet
+        
+        Returns:
+            Dict[str, str]: "ready", "unavailable" or "not loaded" for each model
+        """
+        status = {}
+        for name, loader in (("nlp_analyzer", load_spacy_model), ("classifier", load_zero_shot_classifier)):
+            if not loader.cache_info().currsize:
+                status[name] = "not loaded"
+            else:
+                status[name] = "ready" if loader() else "unavailable"
+        return status
+    
+    def parse_text(self, text: str) -> Optional[Doc]:
+        """
+        Parse text with spaCy once so the resulting Doc can be shared by all NLP consumers
+        
+        Args:
+            text (str): Resume text to parse
             
-        except Exception as e:
-            logger.error(f"Error initializing NLP models: {e}")
-            self.nlp_model = None
-            self.classifier = None
+        Returns:
+            Optional[Doc]: Parsed document or None if spaCy model is unavailable
+        """
+        if not self.nlp_model:
+            return None
+        return self.nlp_model(text)
     
-    def analyze_text_with_nlp(self, text: str, target_role: str = "Software Engineer") -> Dict[str, Any]:
+    def analyze_text_with_nlp(
+        self, 
+        text: str, 
+        target_role: str = "Software Engineer", 
+        doc: Optional[Doc] = None
+    ) -> Dict[str, Any]:
         """
         Perform comprehensive NLP analysis on resume text
         
         Args:
             text (str): Resume text to analyze
             target_role (str): Target job role for matching
+            doc (Optional[Doc]): Already parsed spaCy Doc of the text, parsed here if not provided
             
         Returns:
             Dict[str, Any]: Analysis results including entities, keywords, and role matching
@@ -61,8 +121,9 @@ class NLPAnalyzer:
             if not self.nlp_model:
                 return self._get_fallback_analysis(text, target_role)
             
-            # Process text with spaCy
-            doc = self.nlp_model(text)
+            # Process text with spaCy, unless caller already parsed it
+            if doc is None:
+                doc = self.nlp_model(text)
             
             # Extract named entities
             entities = [
@@ -1,6 +1,7 @@
 import logging
 from features.resume.config import ResumeAnalyzerConfig
 from typing import Dict, Any, Optional
+from spacy.tokens import Doc
 from transformers import pipeline
 import re
 from features.resume.utils.utils import NLPAnalyzer
@@ -21,12 +22,13 @@ class PersonalInfoExtractor:
         self.github_pattern = r'github\.com/[A-Za-z0-9_-]+'
         self.linkedin_pattern = r'linkedin\.com/in/[A-Za-z0-9_-]+'
     
-    def extract_personal_info(self, text: str) -> Dict[str, Optional[str]]:
+    def extract_personal_info(self, text: str, doc: Optional[Doc] = None) -> Dict[str, Optional[str]]:
         """
         Extract personal information from resume text
         
         Args:
             text (str): Resume text to analyze
+            doc (Optional[Doc]): Already parsed spaCy Doc of the text, parsed here if not provided
             
         Returns:
             Dict[str, Optional[str]]: Extracted personal information
@@ -43,7 +45,7 @@ class PersonalInfoExtractor:
             
             # Extract using NLP if available
             if self.nlp_analyzer.nlp_model:
-                personal_info.update(self._extract_with_nlp(text))
+                personal_info.update(self._extract_with_nlp(text, doc))
             
             # Extract using regex patterns
             personal_info.update(self._extract_with_regex(text))
@@ -60,18 +62,20 @@ class PersonalInfoExtractor:
                 "social_links": []
             }
     
-    def _extract_with_nlp(self, text: str) -> Dict[str, str]:
+    def _extract_with_nlp(self, text: str, doc: Optional[Doc] = None) -> Dict[str, str]:
         """
         Extract personal info using NLP named entity recognition
         
         Args:
             text (str): Resume text
+            doc (Optional[Doc]): Already parsed spaCy Doc of the text
             
         Returns:
             Dict[str, str]: Extracted entities
         """
         info = {}
-        doc = self.nlp_analyzer.nlp_model(text)
+        if doc is None:
+            doc = self.nlp_analyzer.nlp_model(text)
         
         names = []
         locations = []
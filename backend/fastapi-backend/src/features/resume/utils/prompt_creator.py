@@ -1,18 +1,13 @@
+import logging
 from typing import List, Any, Dict, Optional, Tuple
+from features.resume.config import ResumeAnalyzerConfig
+from features.resume.utils.llm_text_preparer import LLMTextPreparer
 
-class PromptCreator:
-    def __init__(self):
-        pass
-      
-    def _create_analysis_prompt(
-            self, 
-            text: str, 
-            target_role: str, 
-            job_description: str, 
-        ) -> str:
-            """Create a precise and structured prompt for resume analysis, ensuring JSON-only output."""
-            
-            system_prompt = """
+logger = logging.getLogger(__name__)
+
+# Static system prompts, built once at import and shared by every request. They must not contain any
+# per request data, so every call sends a byte identical prefix that the provider can serve from its prompt cache
+ANALYSIS_SYSTEM_PROMPT = """
 You are a highly experienced Resume Analyst with over 15 years in talent acquisition, career development, and ATS optimization.
 🛠 OBJECTIVE:
 You must analyze a resume against a specific job description and role. Return *only* a strictly valid JSON object summarizing the analysis.
@@ -56,26 +51,7 @@ You must analyze a resume against a specific job description and role. Return *o
 4. ATS-friendliness, keyword richness, formatting quality
 5. Overall presentation, clarity, and professionalism""".strip()
 
-            user_prompt = f"""
-        Analyze the following resume for its suitability for the role below and provide your analysis in the defined JSON structure only.
-
-        🎯 TARGET ROLE:
-        {target_role}
-
-        📄 JOB DESCRIPTION:
-        {job_description or "No specific JD provided — perform general analysis based on industry norms."}
-
-        📌 RESUME CONTENT:
-        {text}
-
-        Follow the evaluation criteria strictly and return only the JSON object as instructed.
-        """.strip()
-
-            return system_prompt, user_prompt 
-    def _create_scoring_prompt(self, text: str, target_role: str, job_description: str) -> str:
-        """Create prompt for resume scoring"""
-
-        system_prompt = """You are an expert resume evaluator specializing in ATS scoring and resume assessment.
+SCORING_SYSTEM_PROMPT = """You are an expert resume evaluator specializing in ATS scoring and resume assessment.
 
 Your task is to rate resumes out of 100 based on the following criteria:
 - Relevance to the target role
@@ -95,29 +71,7 @@ Respond only with a JSON object containing the following keys:
 
 NOTE: Only output in JSON format, don't give anything apart from the JSON object."""
 
-        user_prompt = f"""Please rate this resume out of 100 for the following role:
-
-TARGET ROLE: {target_role}
-
-JOB DESCRIPTION: {job_description if job_description else "General evaluation"}
-
-RESUME CONTENT:
-{text}
-
-Provide your assessment in the specified JSON format."""
-
-        return system_prompt, user_prompt
-    
-    def _create_improvement_prompt(
-        self, 
-        section_text: str, 
-        section_name: str, 
-        target_role: str, 
-        job_description: str
-    ) -> str:
-        """Create prompt for section improvement"""
-
-        system_prompt = f"""You are an expert resume writer specializing in optimizing resume sections for maximum impact.
+IMPROVEMENT_SYSTEM_PROMPT = """You are an expert resume writer specializing in optimizing resume sections for maximum impact.
 
 Your task is to improve resume sections to make them:
 - More impactful and results-oriented
@@ -127,28 +81,7 @@ Your task is to improve resume sections to make them:
 
 Focus on enhancing the content while maintaining authenticity."""
 
-        user_prompt = f"""Please improve this {section_name} section for the specified role:
-
-TARGET ROLE: {target_role}
-
-JOB DESCRIPTION: {job_description[:300] if job_description else "General improvement"}
-
-ORIGINAL {section_name.upper()} SECTION:
-{section_text}
-
-Provide an improved version of this section that is more impactful, ATS-friendly, and relevant to the target role."""
-
-        return system_prompt, user_prompt
-    
-    def _create_generation_prompt(
-        self, 
-        sections_summary: str, 
-        target_role: str, 
-        job_description: str
-    ) -> str:
-        """Create prompt for complete resume generation"""
-
-        system_prompt = """You are an expert resume writer specializing in creating professional, ATS-optimized resumes.
+GENERATION_SYSTEM_PROMPT = """You are an expert resume writer specializing in creating professional, ATS-optimized resumes.
 
 Your task is to create complete, well-structured resumes that include:
 - Professional Summary
@@ -165,21 +98,7 @@ Format requirements:
 - Maintain professional formatting
 - Focus on quantifiable achievements"""
 
-        user_prompt = f"""Please create a professional, ATS-optimized resume for the following role:
-
-TARGET ROLE: {target_role}
-
-JOB REQUIREMENTS: {job_description[:400] if job_description else "General requirements"}
-
-CURRENT RESUME SECTIONS:
-{sections_summary}
-
-Generate a complete, well-structured resume based on the provided information."""
-
-        return system_prompt, user_prompt
-
-    def _create_career_suggestion_prompt(self, skill_scores: List, overall_score: float) -> str:
-        system_prompt = """You are an expert career mentor with extensive experience in career guidance and skill assessment.
+CAREER_SUGGESTION_SYSTEM_PROMPT = """You are an expert career mentor with extensive experience in career guidance and skill assessment.
 
 Your task is to provide career suggestions based on skill scores and overall performance. You need to analyze the data and provide:
 
@@ -217,24 +136,7 @@ RESPONSE FORMAT:
 
 NOTE: Only return JSON object and nothing else."""
 
-        user_prompt = f"""Based on the following skill assessment data, provide career suggestions:
-
-SKILL SCORES: {str(skill_scores)}
-
-OVERALL SCORE: {overall_score}
-
-Analyze this data and provide role suggestions, strengths, improvement areas, and tips in the specified JSON format."""
-
-        return system_prompt, user_prompt
-     
-    def _create_section_prompt(
-        self, 
-        text: str, 
-        target_role: str, 
-        job_description: str
-    ) -> str:
-        """Create prompt for resume analysis returning only a JSON object"""
-        system_prompt = """You are a professional resume evaluation expert specializing in section-by-section analysis.
+SECTION_SYSTEM_PROMPT = """You are a professional resume evaluation expert specializing in section-by-section analysis.
 
 Your task is to analyze resume sections and provide detailed feedback for each section including:
 - Brief description of the section
@@ -289,22 +191,7 @@ IMPORTANT:
 - If a section is not found, set arrays to [] and overall_review to "Needs Improvement"
 - Return ONLY the JSON object, no explanations"""
 
-        user_prompt = f"""Please analyze the following resume sections for the specified role:
-
-TARGET ROLE: {target_role}
-
-JOB DESCRIPTION: {job_description or "No specific job description provided"}
-
-RESUME TEXT:
-{text}
-
-Provide a detailed section-by-section analysis in the specified JSON format."""
-
-        return system_prompt, user_prompt
-    
-    def _create_skill_assessment_prompt(self, technical_skills: str, soft_skills: str):
-        
-        system_prompt = """You are an expert assessment generator specializing in creating comprehensive skill evaluations.
+SKILL_ASSESSMENT_SYSTEM_PROMPT = """You are an expert assessment generator specializing in creating comprehensive skill evaluations.
 
 Your task is to generate 10 multiple choice questions that test understanding and practical knowledge of both technical and soft skills.
 
@@ -333,32 +220,9 @@ RESPONSE FORMAT:
 
 Do not include any explanations, comments, or markdown. Output only the pure JSON object."""
 
-        user_prompt = f"""Generate 10 multiple choice questions based on the following skills:
-
-TECHNICAL SKILLS: {technical_skills}
-
-SOFT SKILLS: {soft_skills}
-
-Create questions that test both theoretical knowledge and practical application of these skills. Return the assessment in the specified JSON format."""
-
-        return system_prompt, user_prompt
-  
-    def _create_experience_section_prompt(
-        self,
-        organisation_name: str, 
-        position: str, 
-        location: str, 
-        description: Optional[List[str]] = None
-    ) -> Tuple[str, str]:
-        if not description:
-            description = ["Description not provided. You must create it from scratch."]
-        
-        if not description:
-            description = ["Description not provided. You must create it from scratch."]
-        
-        system_prompt = f"""You are a resume writing assistant specializing in creating strong professional experience descriptions.
+EXPERIENCE_SECTION_SYSTEM_PROMPT = """You are a resume writing assistant specializing in creating strong professional experience descriptions.
 
-Your task is to generate {len(description)} impactful bullet points for a work experience entry.
+Your task is to generate impactful bullet points for a work experience entry, exactly as many as requested.
 
 Requirements:
 - Write in third person and keep it resume-appropriate
@@ -371,30 +235,9 @@ Requirements:
 
 Return ONLY the final improved bullet points in the specified format."""
 
-        user_prompt = f"""Please generate professional experience bullet points for:
-
-ORGANISATION: {organisation_name}
-POSITION: {position}
-LOCATION: {location}
-EXISTING POINTS: {description}
+EXTRACURRICULAR_SECTION_SYSTEM_PROMPT = """You are a resume writing assistant specializing in presenting extracurricular activities professionally.
 
-Create {len(description)} enhanced bullet points that highlight achievements and impact."""
-
-        return system_prompt, user_prompt
-     
-    def _create_extracurricular_section_prompt(
-        self,
-        organisation_name: str, 
-        position: str, 
-        location: str, 
-        description: Optional[List[str]] = None
-    ) -> str:
-        if not description:
-            description = ["Bullet points not provided. You must create it from scratch."]
-
-        system_prompt = f"""You are a resume writing assistant specializing in presenting extracurricular activities professionally.
-
-Your task is to generate exactly {len(description)} bullet point(s) for an extracurricular activity.
+Your task is to generate exactly the requested number of bullet point(s) for an extracurricular activity.
 
 Requirements:
 - Write in third person, past tense
@@ -407,30 +250,9 @@ Requirements:
 
 Return only the final improved bullet points in the specified format."""
 
-        user_prompt = f"""Please generate professional extracurricular activity bullet points for:
-
-ORGANISATION: {organisation_name}
-POSITION: {position}
-LOCATION: {location}
-EXISTING BULLET POINTS: {description}
-
-Create {len(description)} enhanced bullet point(s) that showcase leadership, impact, and skills developed."""
-
-        return system_prompt, user_prompt
-   
-    def _create_project_section_prompt(
-        self,
-        project_name: str,
-        tech_stack: str,
-        bullet_points: Optional[List[str]] = None
-    ):
-        
-        if not bullet_points:
-            bullet_points = []
-        
-        system_prompt = f"""You are a technical resume writer specializing in project portfolio presentation.
+PROJECT_SECTION_SYSTEM_PROMPT = """You are a technical resume writer specializing in project portfolio presentation.
 
-Your task is to create {len(bullet_points)} enhanced technical bullet points that demonstrate:
+Your task is to create the requested number of enhanced technical bullet points that demonstrate:
 1. Technical proficiency and problem-solving
 2. Innovative solutions and methodologies
 3. Project impact and user value
@@ -448,19 +270,7 @@ Requirements:
 
 Return only the enhanced technical descriptions in the specified format."""
 
-        user_prompt = f"""Please enhance the following project information:
-
-PROJECT NAME: {project_name}
-TECHNOLOGIES: {tech_stack}
-CURRENT POINTS: {str(bullet_points)}
-
-Generate exactly {len(bullet_points)} enhanced technical bullet points that showcase technical expertise and project impact."""
-
-        return system_prompt, user_prompt
-    
-    def _create_resume_parser_prompt(self, text: str):
-        
-        system_prompt = """You are an expert resume parser specializing in extracting structured data from resumes.
+RESUME_PARSER_SYSTEM_PROMPT = """You are an expert resume parser specializing in extracting structured data from resumes.
 
     Your task is to extract resume information and format it as a JSON object with the following structure:
 
@@ -601,17 +411,7 @@ Generate exactly {len(bullet_points)} enhanced technical bullet points that show
 
     CRITICAL: Return ONLY the JSON object. No explanations, no markdown, no additional text."""
 
-        user_prompt = f"""Please extract and structure the following resume data:
-
-    RESUME TEXT:
-    {text}
-
-    Parse this resume and return the structured data in the specified JSON format. Remember: use empty arrays [] for missing list data, not objects with null values."""
-
-        return system_prompt, user_prompt
-    
-    def _create_ats_prompt(self, resume_data: dict) -> str:
-        system_prompt = """You are an advanced Applicant Tracking System (ATS) evaluator specializing in resume assessment.
+ATS_SYSTEM_PROMPT = """You are an advanced Applicant Tracking System (ATS) evaluator specializing in resume assessment.
 
 Your task is to evaluate resumes based on 3 key criteria:
 
@@ -645,6 +445,240 @@ RESPONSE FORMAT:
 
 Assume the resume is written in clean and ATS-compatible LaTeX format."""
 
+class PromptCreator:
+    def __init__(self):
+        self.text_preparer = LLMTextPreparer()
+        
+    def _limit_job_description(self, job_description: str) -> str:
+        """Limit job description to its token budget before it is added to a prompt"""
+        return self.text_preparer.truncate_to_tokens(
+            job_description, ResumeAnalyzerConfig.MAX_PROMPT_JOB_DESCRIPTION_TOKENS
+        )
+      
+    def _create_analysis_prompt(
+            self, 
+            text: str, 
+            target_role: str, 
+            job_description: str, 
+        ) -> str:
+            """Create a precise and structured prompt for resume analysis, ensuring JSON-only output."""
+            
+            system_prompt = ANALYSIS_SYSTEM_PROMPT
+
+            user_prompt = f"""
+        Analyze the following resume for its suitability for the role below and provide your analysis in the defined JSON structure only.
+
+        🎯 TARGET ROLE:
+        {target_role}
+
+        📄 JOB DESCRIPTION:
+        {self._limit_job_description(job_description) if job_description else "No specific JD provided — perform general analysis based on industry norms."}
+
+        📌 RESUME CONTENT:
+        {text}
+
+        Follow the evaluation criteria strictly and return only the JSON object as instructed.
+        """.strip()
+
+            return system_prompt, user_prompt 
+    def _create_scoring_prompt(self, text: str, target_role: str, job_description: str) -> str:
+        """Create prompt for resume scoring"""
+
+        system_prompt = SCORING_SYSTEM_PROMPT
+
+        user_prompt = f"""Please rate this resume out of 100 for the following role:
+
+TARGET ROLE: {target_role}
+
+JOB DESCRIPTION: {self._limit_job_description(job_description) if job_description else "General evaluation"}
+
+RESUME CONTENT:
+{text}
+
+Provide your assessment in the specified JSON format."""
+
+        return system_prompt, user_prompt
+    
+    def _create_improvement_prompt(
+        self, 
+        section_text: str, 
+        section_name: str, 
+        target_role: str, 
+        job_description: str
+    ) -> str:
+        """Create prompt for section improvement"""
+
+        system_prompt = IMPROVEMENT_SYSTEM_PROMPT
+
+        user_prompt = f"""Please improve this {section_name} section for the specified role:
+
+TARGET ROLE: {target_role}
+
+JOB DESCRIPTION: {self._limit_job_description(job_description) if job_description else "General improvement"}
+
+ORIGINAL {section_name.upper()} SECTION:
+{section_text}
+
+Provide an improved version of this section that is more impactful, ATS-friendly, and relevant to the target role."""
+
+        return system_prompt, user_prompt
+    
+    def _create_generation_prompt(
+        self, 
+        sections_summary: str, 
+        target_role: str, 
+        job_description: str
+    ) -> str:
+        """Create prompt for complete resume generation"""
+
+        system_prompt = GENERATION_SYSTEM_PROMPT
+
+        user_prompt = f"""Please create a professional, ATS-optimized resume for the following role:
+
+TARGET ROLE: {target_role}
+
+JOB REQUIREMENTS: {self._limit_job_description(job_description) if job_description else "General requirements"}
+
+CURRENT RESUME SECTIONS:
+{sections_summary}
+
+Generate a complete, well-structured resume based on the provided information."""
+
+        return system_prompt, user_prompt
+
+    def _create_career_suggestion_prompt(self, skill_scores: List, overall_score: float) -> str:
+        system_prompt = CAREER_SUGGESTION_SYSTEM_PROMPT
+
+        user_prompt = f"""Based on the following skill assessment data, provide career suggestions:
+
+SKILL SCORES: {str(skill_scores)}
+
+OVERALL SCORE: {overall_score}
+
+Analyze this data and provide role suggestions, strengths, improvement areas, and tips in the specified JSON format."""
+
+        return system_prompt, user_prompt
+     
+    def _create_section_prompt(
+        self, 
+        text: str, 
+        target_role: str, 
+        job_description: str
+    ) -> str:
+        """Create prompt for resume analysis returning only a JSON object"""
+        system_prompt = SECTION_SYSTEM_PROMPT
+
+        user_prompt = f"""Please analyze the following resume sections for the specified role:
+
+TARGET ROLE: {target_role}
+
+JOB DESCRIPTION: {self._limit_job_description(job_description) if job_description else "No specific job description provided"}
+
+RESUME TEXT:
+{text}
+
+Provide a detailed section-by-section analysis in the specified JSON format."""
+
+        return system_prompt, user_prompt
+    
+    def _create_skill_assessment_prompt(self, technical_skills: str, soft_skills: str):
+        
+        system_prompt = SKILL_ASSESSMENT_SYSTEM_PROMPT
+
+        user_prompt = f"""Generate 10 multiple choice questions based on the following skills:
+
+TECHNICAL SKILLS: {technical_skills}
+
+SOFT SKILLS: {soft_skills}
+
+Create questions that test both theoretical knowledge and practical application of these skills. Return the assessment in the specified JSON format."""
+
+        return system_prompt, user_prompt
+  
+    def _create_experience_section_prompt(
+        self,
+        organisation_name: str, 
+        position: str, 
+        location: str, 
+        description: Optional[List[str]] = None
+    ) -> Tuple[str, str]:
+        if not description:
+            description = ["Description not provided. You must create it from scratch."]
+        
+        system_prompt = EXPERIENCE_SECTION_SYSTEM_PROMPT
+
+        user_prompt = f"""Please generate professional experience bullet points for:
+
+ORGANISATION: {organisation_name}
+POSITION: {position}
+LOCATION: {location}
+EXISTING POINTS: {description}
+
+Create {len(description)} enhanced bullet points that highlight achievements and impact."""
+
+        return system_prompt, user_prompt
+     
+    def _create_extracurricular_section_prompt(
+        self,
+        organisation_name: str, 
+        position: str, 
+        location: str, 
+        description: Optional[List[str]] = None
+    ) -> str:
+        if not description:
+            description = ["Bullet points not provided. You must create it from scratch."]
+
+        system_prompt = EXTRACURRICULAR_SECTION_SYSTEM_PROMPT
+
+        user_prompt = f"""Please generate professional extracurricular activity bullet points for:
+
+ORGANISATION: {organisation_name}
+POSITION: {position}
+LOCATION: {location}
+EXISTING BULLET POINTS: {description}
+
+Create {len(description)} enhanced bullet point(s) that showcase leadership, impact, and skills developed."""
+
+        return system_prompt, user_prompt
+   
+    def _create_project_section_prompt(
+        self,
+        project_name: str,
+        tech_stack: str,
+        bullet_points: Optional[List[str]] = None
+    ):
+        
+        if not bullet_points:
+            bullet_points = []
+        
+        system_prompt = PROJECT_SECTION_SYSTEM_PROMPT
+
+        user_prompt = f"""Please enhance the following project information:
+
+PROJECT NAME: {project_name}
+TECHNOLOGIES: {tech_stack}
+CURRENT POINTS: {str(bullet_points)}
+
+Generate exactly {len(bullet_points)} enhanced technical bullet points that showcase technical expertise and project impact."""
+
+        return system_prompt, user_prompt
+    
+    def _create_resume_parser_prompt(self, text: str):
+        
+        system_prompt = RESUME_PARSER_SYSTEM_PROMPT
+
+        user_prompt = f"""Please extract and structure the following resume data:
+
+    RESUME TEXT:
+    {text}
+
+    Parse this resume and return the structured data in the specified JSON format. Remember: use empty arrays [] for missing list data, not objects with null values."""
+
+        return system_prompt, user_prompt
+    
+    def _create_ats_prompt(self, resume_data: dict) -> str:
+        system_prompt = ATS_SYSTEM_PROMPT
+
         # Extract resume data for user prompt
         personal_info = resume_data.get("personal_info", {})
         name = personal_info.get("name", "N/A")
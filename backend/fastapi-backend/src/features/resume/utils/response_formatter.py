@@ -1,7 +1,6 @@
 import logging
 from typing import Optional, Dict, List, Any
 import uuid
-from datetime import datetime
 from features.resume.schemas import (
     ResumeMetadata, ResumeAnalysisResponse, ResumeDetails, ResumeAnalyzer, ResumeAnalysisResult,
     ResumeDetailsResponse
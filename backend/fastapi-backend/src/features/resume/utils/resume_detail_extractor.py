@@ -1,31 +1,20 @@
-from groq import Groq
-from features.resume.config import ResumeAnalyzerConfig
 import logging
-from typing import Optional, Dict
-import re, json
+from typing import Optional, Tuple, Any
+import re
+import orjson
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
-class ResumeDetailsExtractor:
-    def __init__(self, logger:logging.Logger):
-        self.groq_client = self._initialize_groq_client()
-        self.model = ResumeAnalyzerConfig.MODEL 
-        
-    def _initialize_groq_client(self) -> Optional[Groq]:
-        """
-        Initialize Groq client for AI analysis
-        
-        Returns:
-            Optional[Groq]: Groq client instance or None if initialization fails
-        """
-        try:
-            client = Groq(api_key=ResumeAnalyzerConfig.GROQ_API_KEY)
-            logger.info("Groq client initialized successfully")
-            return client
-        except Exception as e:
-            logger.error(f"Error initializing Groq client: {e}")
-            return None
+# Characters that change the brace matching state, everything else is skipped
+JSON_STRUCTURAL_CHAR_PATTERN = re.compile(r'[{}"\\]')
 
+# JSON extracted from recent responses that needed extraction, least recently used evicted first.
+# Cached LLM responses come back verbatim, so the same text is otherwise extracted on every call.
+EXTRACTED_JSON_CACHE_MAX_ENTRIES = 256
+EXTRACTED_JSON_CACHE: "OrderedDict[str, str]" = OrderedDict()
+
+class ResumeDetailsExtractor:
     @staticmethod
     def extract_json_from_response(response_text):
         """
@@ -37,80 +26,81 @@ class ResumeDetailsExtractor:
         Returns:
             str: Clean JSON string, or None if no valid JSON found
         """
-        
+        extracted = ResumeDetailsExtractor._extract_json(response_text)
+        return extracted[0] if extracted else None
+    
+    @staticmethod
+    def _extract_json(response_text: str) -> Optional[Tuple[str, Any]]:
+        """Find the JSON object in the response, giving both its text and the parsed data so it is parsed only once"""
         logger.info("Extracting json from llm response of resume text")
         if not response_text:
             return None
         
         # Remove common markdown formatting
         text = response_text.strip()
-        text = re.sub(r'^```json\s*', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^```\s*$', '', text, flags=re.MULTILINE)
-        text = text.strip()
+        if text.startswith("```json"):
+            text = text[7:].lstrip()
+        elif text.startswith("```"):
+            text = text[3:].lstrip()
+        if text.endswith("```"):
+            text = text[:-3].rstrip()
         
         # Method 1: Try to find JSON between first { and last }
         first_brace = text.find('{')
         last_brace = text.rfind('}')
+        if first_brace == -1 or last_brace < first_brace:
+            # No object in the response at all
+            return None
         
-        if first_brace != -1 and last_brace != -1 and first_brace < last_brace:
-            potential_json = text[first_brace:last_brace + 1]
-            
-            # Validate if it's proper JSON
-            try:
-                json.loads(potential_json)
-                return potential_json
-            except json.JSONDecodeError:
-                pass
-        
-        # Method 2: Use regex to find JSON-like structures
-        json_patterns = [
-            r'\{.*\}',  # Basic { to } matching
-            r'\{[\s\S]*\}',  # Multi-line { to } matching
-        ]
-        
-        for pattern in json_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
-            for match in matches:
-                try:
-                    json.loads(match)
-                    return match
-                except json.JSONDecodeError:
-                    continue
-        
-        # Method 3: Try to clean common prefixes/suffixes
-        cleaning_patterns = [
-            (r'^.*?(\{.*\}).*?$', r'\1'),  # Extract content between first { and last }
-            (r'^[^{]*(\{.*\})[^}]*$', r'\1'),  # Remove text before first { and after last }
-            (r'Here\'s the JSON:?\s*(\{.*\})', r'\1'),  # Remove "Here's the JSON:" prefix
-            (r'```json\s*(\{.*\})\s*```', r'\1'),  # Remove markdown code blocks
-            (r'^.*?JSON.*?:?\s*(\{.*\})', r'\1'),  # Remove any JSON-related prefix
-        ]
+        # Span already parsed without success, so the scan below does not parse it again
+        failed_span = None
+        potential_json = text[first_brace:last_brace + 1]
         
-        for pattern, replacement in cleaning_patterns:
-            cleaned = re.sub(pattern, replacement, text, flags=re.DOTALL | re.IGNORECASE)
+        # Validate if it's proper JSON, only parsing when the braces balance. Braces inside
+        # strings can unbalance a valid object, the scan below handles those.
+        if potential_json.count('{') == potential_json.count('}'):
             try:
-                json.loads(cleaned)
-                return cleaned
-            except json.JSONDecodeError:
-                continue
+                return potential_json, orjson.loads(potential_json)
+            except orjson.JSONDecodeError:
+                failed_span = (first_brace, last_brace)
         
-        # Method 4: Manual brace matching for nested JSON
+        # Method 2: Single pass brace matching for JSON surrounded by other text, braces inside
+        # strings are skipped so they do not unbalance the count. The regex scan jumps between
+        # structural characters in C, so plain text is never looped over in Python.
         brace_count = 0
         start_idx = -1
+        in_string = False
+        escaped_idx = -1
         
-        for i, char in enumerate(text):
-            if char == '{':
+        for match in JSON_STRUCTURAL_CHAR_PATTERN.finditer(text):
+            i = match.start()
+            if i == escaped_idx:
+                continue
+            char = match.group()
+            
+            if in_string:
+                if char == '\\':
+                    escaped_idx = i + 1
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                # Strings only matter inside an object, quotes in the surrounding text are ignored
+                in_string = brace_count > 0
+            elif char == '{':
                 if brace_count == 0:
                     start_idx = i
                 brace_count += 1
-            elif char == '}':
+            elif char == '}' and brace_count > 0:
                 brace_count -= 1
-                if brace_count == 0 and start_idx != -1:
+                if brace_count == 0:
+                    if (start_idx, i) == failed_span:
+                        # The whole span is one balanced object which is not valid JSON, and
+                        # there is nothing after it, so no other candidate exists
+                        return None
                     potential_json = text[start_idx:i + 1]
                     try:
-                        json.loads(potential_json)
-                        return potential_json
-                    except json.JSONDecodeError:
+                        return potential_json, orjson.loads(potential_json)
+                    except orjson.JSONDecodeError:
                         continue
         
         return None
@@ -121,19 +111,38 @@ class ResumeDetailsExtractor:
         Parse resume response and extract clean JSON.
         
         Args:
-            groq_response: The response object from Groq API
+            response_text (str): The raw response from the LLM
             
         Returns:
             dict: Parsed JSON data, or None if extraction failed
         """
+        if not response_text:
+            # Failed LLM calls give no response at all
+            return None
+        
         try:
+            # Fast path, the prompts ask for nothing but the JSON object
+            stripped = response_text.strip()
+            if stripped.startswith('{'):
+                try:
+                    return orjson.loads(stripped)
+                except orjson.JSONDecodeError:
+                    pass
+            
+            # A response seen before reuses its extracted JSON, parsed again so every caller gets its own objects
+            json_string = EXTRACTED_JSON_CACHE.get(response_text)
+            if json_string is not None:
+                EXTRACTED_JSON_CACHE.move_to_end(response_text)
+                return orjson.loads(json_string)
             
-            # Extract JSON string
-            json_string = ResumeDetailsExtractor.extract_json_from_response(response_text)
+            # Extract the JSON object, already parsed while it was validated
+            extracted = ResumeDetailsExtractor._extract_json(response_text)
             
-            if json_string:
-                # Parse and return as dictionary
-                return json.loads(json_string)
+            if extracted:
+                EXTRACTED_JSON_CACHE[response_text] = extracted[0]
+                if len(EXTRACTED_JSON_CACHE) > EXTRACTED_JSON_CACHE_MAX_ENTRIES:
+                    EXTRACTED_JSON_CACHE.popitem(last=False)
+                return extracted[1]
             else:
                 logger.warning("Could not extract valid JSON from response")
                 logger.warning("Raw response: %s", response_text[:200] + "..." if len(response_text) > 200 else response_text)
@@ -142,173 +151,3 @@ class ResumeDetailsExtractor:
         except Exception as e:
             logger.error(f"Error parsing resume response: {str(e)}")
             return None
-
-    def create_resume_parser_prompt(self, text: str):
-        prompt = f"""EXTRACT RESUME DATA TO JSON ONLY.
-CRITICAL: Please return ONLY the JSON object. No explanations, no markdown, no additional text. Start with {{ and end with }}.
-JSON SCHEMA:
-{{
-"resume_details": {{
-    "personal_info": {{
-    "name": "candidate full name",
-    "contact_info": {{
-        "email": "email address as a string",
-        "mobile": "phone number",
-        "location": "city, state/country",
-        "social_links": {{
-            "linkedin": "linkedin profile url",
-            "github": "github profile url",
-            "portfolio": "portfolio website url"
-        }}
-    }},
-    "professional_summary": "professional summary or objective statement"
-    }},
-    "educations": [
-    {{
-        "institute_name": "university/college name",
-        "degree": "degree type (B.Tech, B.Sc, M.Sc, etc.)",
-        "specialisation": "field of study",
-        "dates": {{
-            "start": "start date",
-            "end": "end date or 'Present'"
-        }},
-        "location": "institute location",
-        "gpa": "GPA/percentage if mentioned",
-        "relevant_coursework": ["course1", "course2", "course3"]
-    }}
-    ],
-    "work_experiences": [
-    {{
-        "company_name": "company name",
-        "job_title": "position title",
-        "date": {{
-        "start": "start date",
-        "end": "end date or 'Present'"
-        }},
-        "location": "work location",
-        "bullet_points": ["responsibility/achievement 1", "responsibility/achievement 2"]
-    }}
-    ],
-    "projects": [
-    {{
-        "title": "project name",
-        "project_link": "project url if available: str",
-        "date": {{
-        "start": "start date",
-        "end": "end date"
-        }},
-        "location": "project location if applicable",
-        "organization": "associated organization if any",
-        "bullet_points": ["key point 1", "key point 2"],
-        "technologies_used": ["tech1", "tech2", "tech3"]
-    }}
-    ],
-    "skills": [
-    {{
-        "skill_group": "Programming Languages",
-        "skills": ["Python", "Java", "JavaScript"]
-    }},
-    {{
-        "skill_group": "Web Technologies", 
-        "skills": ["React", "HTML", "CSS"]
-    }},
-    {{
-        "skill_group": "Databases",
-        "skills": ["MySQL", "PostgreSQL", "MongoDB"]
-    }},
-    {{
-        "skill_group": "Cloud Platforms",
-        "skills": ["AWS", "Azure", "GCP"]
-    }},
-    {{
-        "skill_group": "Tools & Frameworks",
-        "skills": ["Git", "Docker", "Kubernetes"]
-    }}
-    ],
-    "achievements": [
-    {{
-        "title": "achievement title",
-        "description": "achievement description",
-        "date_achieved": "date of achievement, if not present then none",
-        "organization": "awarding organization, if not present then none"
-    }}
-    ],
-    "certifications": [
-    {{
-        "certificate_name": "certification name",
-        "issuing_organization": "issuing body",
-        "date_issued": "issue date, if not present then None",
-        "expiry_date": "expiry date if applicable, if not present then None",
-        "description": "certification description"
-    }}
-    ],
-    "languages": [
-    {{
-        "language": "language name",
-        "proficiency": "proficiency level (Native, Fluent, Intermediate, Basic)"
-    }}
-    ],
-    "publications": [
-    {{
-        "publication_name": "publication title",
-        "authors": ["author1", "author2"],
-        "publication_date": "publication date",
-        "journal_conference": "journal or conference name",
-        "description": "brief description"
-    }}
-    ],
-    "extracurriculars": [
-    {{
-        "title": "activity title",
-        "organization_name": "organization name",
-        "role": "role/position held",
-        "date": {{  "start": "start date",  "end": "end date"  }},
-        "bullet_points": ["activity detail 1", "activity detail 2"],
-        "certificate": "Any proof of work or certificate link",
-        "location": "Where candidate was part of the acitivity."
-    }}
-    ]
-}}
-}}
-PARSING RULES:
-1. Extract information only if explicitly mentioned in the resume
-2. Use empty arrays [] for missing list fields
-3. Use empty strings "" for missing string fields
-4. Use null for missing object fields
-5. Preserve original date formats when possible
-6. Group skills logically by category
-7. Include all bullet points as separate array elements
-8. Extract URLs exactly as written
-RESUME TEXT:
-{text}
-    """.strip()
-
-        return prompt
-
-
-    def get_resume_details(self, text: str) -> Optional[Dict[str, any]]:
-        '''Method to extract the details of the resume in structured manner from reume
-        
-        Args:
-            text: Extracted resume text
-        
-        Returns:
-            dict: Python object with resume details 
-        '''
-        try:
-            logger.info("Sent the text to groq for getting structured output of the resume")
-            
-            prompt = self.create_resume_parser_prompt(text)
-            response = self.groq_client.chat.completions.create(
-                model="llama3-8b-8192",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=4000,
-                temperature=0.7
-            )
-            analysis = response.choices[0].message.content.strip()
-            # extracted_json = self.extract_json_from_response(analysis)
-            return self.parse_resume_with_json_extraction(analysis)
-        except Exception as e:
-            logger.error(f"Error getting resume details from llm: {str(e)}")
-            return None
-        
\ No newline at end of file
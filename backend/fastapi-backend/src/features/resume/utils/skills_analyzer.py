@@ -1,9 +1,51 @@
-import logging
+import logging, re
+from functools import lru_cache
 from features.resume.config import ResumeAnalyzerConfig
-from typing import Tuple, List
+from typing import Tuple, List, Dict, FrozenSet, Pattern
 from features.resume.schemas import SkillGroup
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _get_skill_matcher() -> Tuple[Pattern[str], Dict[str, FrozenSet[str]]]:
+    """Build the pattern matching every configured skill and the lookup of skills to their prefix skills, once"""
+    # Single pattern for all skills, tried at every word start through a lookahead so skills
+    # overlapping each other are all found. Longest first, the shorter skills starting at the
+    # same position (e.g. "react" in "react native") are added through their prefix lookup.
+    all_skills = sorted(
+        {
+            skill.lower()
+            for skill_groups in (ResumeAnalyzerConfig.TECHNICAL_SKILLS, ResumeAnalyzerConfig.SOFT_SKILLS)
+            for skills_list in skill_groups.values()
+            for skill in skills_list
+        },
+        key=len, 
+        reverse=True
+    )
+    skill_pattern = re.compile(
+        r"(?<!\w)(?=(" + "|".join(map(re.escape, all_skills)) + r")(?!\w))",
+        re.IGNORECASE
+    )
+    skill_prefixes = {
+        skill: frozenset(
+            prefix for prefix in all_skills
+            if len(prefix) < len(skill) and skill.startswith(prefix) and not re.match(r"\w", skill[len(prefix)])
+        )
+        for skill in all_skills
+    }
+    return skill_pattern, skill_prefixes
+
+@lru_cache(maxsize=32)
+def _find_skills(text: str) -> FrozenSet[str]:
+    """Find all known skills present in text in a single scan, cached so the same resume or
+    job description is only scanned once across the skill detection and matching calls"""
+    skill_pattern, skill_prefixes = _get_skill_matcher()
+    found_skills = set()
+    for match in skill_pattern.finditer(text):
+        skill = match.group(1).lower()
+        found_skills.add(skill)
+        found_skills.update(skill_prefixes.get(skill, ()))
+    return frozenset(found_skills)
+
 class SkillsAnalyzer:
     """Analyzes and matches skills from resume text"""
     
@@ -11,6 +53,31 @@ class SkillsAnalyzer:
         # self.logger = logger
         self.technical_skill_groups = ResumeAnalyzerConfig.TECHNICAL_SKILLS
         self.soft_skill_groups = ResumeAnalyzerConfig.SOFT_SKILLS
+        
+        # Lookup of every known skill to its category, built once
+        self._technical_skill_lookup = {
+            skill.lower(): group_name
+            for group_name, skills_list in self.technical_skill_groups.items()
+            for skill in skills_list
+        }
+        self._soft_skill_lookup = {
+            skill.lower(): group_name
+            for group_name, skills_list in self.soft_skill_groups.items()
+            for skill in skills_list
+        }
+
+    @staticmethod
+    def _group_skills(found_skills: FrozenSet[str], skill_groups: Dict[str, List[str]]) -> List[SkillGroup]:
+        """Bucket found skills into their groups, keeping configured order"""
+        groups = []
+        for group_name, skills_list in skill_groups.items():
+            group_skills = [skill for skill in skills_list if skill.lower() in found_skills]
+            if group_skills:  # Only add groups that have found skills
+                groups.append(SkillGroup(
+                    skill_group=group_name,
+                    skills=group_skills
+                ))
+        return groups
     
     def detect_skills_by_groups(self, text: str) -> Tuple[List[SkillGroup], List[SkillGroup]]:
         """
@@ -23,33 +90,11 @@ class SkillsAnalyzer:
             Tuple[List[SkillGroup], List[SkillGroup]]: Technical skill groups and soft skill groups found
         """
         try:
-            text_lower = text.lower()
-            
-            # Find technical skills by groups
-            technical_groups = []
-            for group_name, skills_list in self.technical_skill_groups.items():
-                found_skills = [
-                    skill for skill in skills_list 
-                    if skill.lower() in text_lower
-                ]
-                if found_skills:  # Only add groups that have found skills
-                    technical_groups.append(SkillGroup(
-                        skill_group=group_name,
-                        skills=found_skills
-                    ))
-            
-            # Find soft skills by groups
-            soft_groups = []
-            for group_name, skills_list in self.soft_skill_groups.items():
-                found_skills = [
-                    skill for skill in skills_list 
-                    if skill.lower() in text_lower
-                ]
-                if found_skills:  # Only add groups that have found skills
-                    soft_groups.append(SkillGroup(
-                        skill_group=group_name,
-                        skills=found_skills
-                    ))
+            found_skills = _find_skills(text)
+            
+            # Find technical and soft skills by groups
+            technical_groups = self._group_skills(found_skills, self.technical_skill_groups)
+            soft_groups = self._group_skills(found_skills, self.soft_skill_groups)
             
             total_technical = sum(len(group.skills) for group in technical_groups)
             total_soft = sum(len(group.skills) for group in soft_groups)
@@ -74,18 +119,18 @@ class SkillsAnalyzer:
             Tuple[List[str], List[str]]: Technical skills and soft skills found
         """
         try:
-            text_lower = text.lower()
+            found_skills = _find_skills(text)
             
             # Find technical skills
             found_technical = [
-                skill for skill in self.technical_skill_groups 
-                if skill.lower() in text_lower
+                skill for skill in self._technical_skill_lookup 
+                if skill in found_skills
             ]
             
             # Find soft skills
             found_soft = [
-                skill for skill in self.soft_skill_groups
-                if skill.lower() in text_lower
+                skill for skill in self._soft_skill_lookup
+                if skill in found_skills
             ]
             
             logger.info(f"Found {len(found_technical)} technical skills and {len(found_soft)} soft skills")
@@ -6,7 +6,7 @@ from features.resume.config import ResumeAnalyzerConfig
 from transformers import pipeline
 import fitz
 from PIL import Image
-import PyPDF2, io, cv2
+import PyPDF2, cv2, mmap
 import numpy as np
 logger = logging.getLogger(__name__)
 
@@ -73,19 +73,11 @@ class TextExtractor:
             str: Extracted text from all pages
         """
         try:
-            
-            with open(pdf_path, "rb") as file:
-                file_content = file.read()
-                
-            # Method 1: Try PyMuPDF
+            # Method 1: Try PyMuPDF, MuPDF reads the file itself so no Python side copy is made
             try:
                 logger.info("Trying PyMuPDF text extraction...")
-                doc = fitz.open(stream=file_content, filetype="pdf")
-                text = ""
-                for page in doc:
-                    page_text = page.get_text("text")
-                    text += page_text + "\\"
-                doc.close()
+                with fitz.open(pdf_path) as doc:
+                    text = "\n".join(page.get_text("text") for page in doc)
                 if len(text.strip()) > 50:
         
                     logger.info("PyMuPDF extraction successful")
@@ -93,15 +85,16 @@ class TextExtractor:
             except Exception as e:
                 logger.warning(f"PyMuPDF failed: {e}")
 
-            # Method 2: Try PyPDF2
+            # Method 2: Try PyPDF2 over a read only memory map of the file
             try:
                 logger.info("Trying PyPDF2 text extraction...")
-                pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-                text = ""
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+                with open(pdf_path, "rb") as file, \
+                        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as pdf_buffer:
+                    pdf_reader = PyPDF2.PdfReader(pdf_buffer)
+                    text = "\n".join(
+                        page_text for page_text in (page.extract_text() for page in pdf_reader.pages) 
+                        if page_text
+                    )
                 if len(text.strip()) > 50:
                     logger.info("PyPDF2 extraction successful")
                  
@@ -112,20 +105,19 @@ class TextExtractor:
             # Method 3: OCR fallback
             try:
                 logger.info("Trying OCR extraction...")
-                doc = fitz.open(stream=file_content, filetype="pdf")
-                text = ""
-                for page in doc:
-                    # Render page to image at higher resolution
-                    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better OCR
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+                page_texts = []
+                with fitz.open(pdf_path) as doc:
+                    for page in doc:
+                        # Render page to image at higher resolution
+                        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better OCR
+                        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
 
-                    # Preprocess image for better OCR
-                    clean_img = self.preprocess_image(img)
+                        # Preprocess image for better OCR
+                        clean_img = self.preprocess_image(img)
 
-                    # Extract text using OCR
-                    ocr_text = pytesseract.image_to_string(clean_img, lang="eng")
-                    text += ocr_text + "\n"
-                doc.close()
+                        # Extract text using OCR
+                        page_texts.append(pytesseract.image_to_string(clean_img, lang="eng"))
+                text = "\n".join(page_texts)
 
                 if len(text.strip()) > 50:
                     logger.info("OCR extraction successful")
@@ -155,11 +147,11 @@ class TextExtractor:
         """
         try:
             doc = Document(docx_path)
-            extracted_text = ""
             
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():  # Skip empty paragraphs
-                    extracted_text += paragraph.text + "\n"
+            # Skip empty paragraphs and join once instead of growing a string
+            extracted_text = "\n".join(
+                paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()
+            )
                     
             return extracted_text.strip()
             
@@ -6,4 +6,6 @@ from features.resume.utils.skills_analyzer import SkillsAnalyzer
 from features.resume.utils.job_match_calculator import JobMatchCalculator
 from features.resume.utils.ai_analyzer import AIAnalyzer
 from features.resume.utils.response_formatter import ResponseFormatter
-from features.resume.utils.resume_detail_extractor import ResumeDetailsExtractor
\ No newline at end of file
+from features.resume.utils.resume_detail_extractor import ResumeDetailsExtractor
+from features.resume.utils.llm_text_preparer import LLMTextPreparer
+from features.resume.utils.json_stream_parser import JSONArrayItemStreamParser
@@ -1,8 +1,9 @@
 from beanie import Document
 from pydantic import EmailStr, Field
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, UTC
 from bson import ObjectId
+from pymongo import IndexModel
 
 class User(Document):
     email: EmailStr
@@ -17,11 +18,15 @@ class User(Document):
     github: Optional[str] = None
     linkedin: Optional[str] = None
     portfolio: Optional[str] = None
-    createdAt: datetime = Field(default_factory=datetime.utcnow)
-    updatedAt: datetime = Field(default_factory=datetime.utcnow)
+    createdAt: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    updatedAt: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     class Settings:
         name = "User"  # matches collection name used by Express backend
+        indexes = [
+            # login and sign up look users up by email, named like the unique index Prisma already created
+            IndexModel([("email", 1)], unique=True, name="User_email_key"),
+        ]
 
     class Config:
         json_schema_extra = {
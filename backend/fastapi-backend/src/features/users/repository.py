@@ -1,13 +1,14 @@
 from typing import Dict, Any
 import logging
 from fastapi import HTTPException, status
-import json
-from datetime import datetime
+from pydantic import ValidationError
+from datetime import datetime, UTC
 from beanie import PydanticObjectId
 from features.resume.models import Resume
 
 logger = logging.getLogger(__name__)
 from features.users.models import User
+from features.users.schemas import UserUpdate
 class UserRepository:
     def __init__(self):
         pass
@@ -35,27 +36,19 @@ class UserRepository:
         try:
             logger.info("User detail update endpoint called")
             
-            # convert user details into python object
-            user_data = json.loads(user_details)
+            # Parse and validate the user details in one pass, keeping only the fields that are provided and not None
+            update_fields = UserUpdate.model_validate_json(user_details).model_dump(exclude_unset=True, exclude_none=True)
             
             # Get the user document
             user_doc: User = user["user"]
             # user_doc = await User.find_one(User.email == user["email"])
             
-            # Update only the fields that are provided and not None
-            update_fields = {}
-            allowed_fields = ["name", "current_profession", "mobile_number", "location", "github", "linkedin", "portfolio"]
-            
-            for field in allowed_fields:
-                if field in user_data and user_data[field] is not None:
-                    update_fields[field] = user_data[field]
-            
             # Always update the updatedAt field
-            update_fields["updatedAt"] = datetime.utcnow()
+            update_fields["updatedAt"] = datetime.now(UTC)
             
             # Perform the update
             if update_fields:
-                await user_doc.update({"$set": update_fields})
+                await user_doc.set(update_fields)
                 logger.info(f"User details updated successfully for user with user-id: {user['user_id']}")
             else:
                 logger.info("No valid fields to update")
@@ -65,7 +58,7 @@ class UserRepository:
                 "message": "User details updated successfully"
             }
             
-        except json.JSONDecodeError as e:
+        except ValidationError as e:
             logger.error(f"Failed to parse json, error: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_406_NOT_ACCEPTABLE,
@@ -97,11 +90,23 @@ class UserRepository:
                 total_resumes = len(resumes)
                 logger.info(f"User {user_id} has {total_resumes} resumes with best ATS score: {best_score}")
                 
+            # Built from the fields directly, every field except id and password
+            user_doc: User = user["user"]
             return {
                 "success": True,
                 "user": {
-                    "_id": str(user['user'].id),
-                    **user["user"].model_dump(exclude={"password", "id"}, by_alias=True), 
+                    "_id": str(user_doc.id),
+                    "email": user_doc.email,
+                    "name": user_doc.name,
+                    "isVerified": user_doc.isVerified,
+                    "current_profession": user_doc.current_profession,
+                    "mobile_number": user_doc.mobile_number,
+                    "location": user_doc.location,
+                    "github": user_doc.github,
+                    "linkedin": user_doc.linkedin,
+                    "portfolio": user_doc.portfolio,
+                    "createdAt": user_doc.createdAt,
+                    "updatedAt": user_doc.updatedAt
                 },
                 "total_resumes": total_resumes,
                 "best_score": best_score
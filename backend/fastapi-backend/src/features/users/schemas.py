@@ -0,0 +1,18 @@
+"""
+User Request Schema
+"""
+
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+
+class UserUpdate(BaseModel):
+    """Details a user can change, every field is optional and unknown fields are ignored"""
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+    
+    name: Optional[str] = None
+    current_profession: Optional[str] = None
+    mobile_number: Optional[str] = None
+    location: Optional[str] = None
+    github: Optional[str] = None
+    linkedin: Optional[str] = None
+    portfolio: Optional[str] = None
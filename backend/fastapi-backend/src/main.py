@@ -12,8 +12,9 @@ from core.server import create_server
 
 import uvicorn
 import logging
-from fastapi import HTTPException, Request, responses
-import os
+from fastapi import HTTPException, Request
+from fastapi.responses import ORJSONResponse
+import os, platform
 from features.resume.router import router as resumes_router
 from features.users.router import router as users_router
 
@@ -27,7 +28,7 @@ app = create_server()
 # Register global error
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return responses.JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -35,6 +36,18 @@ async def http_exception_handler(request: Request, exc: HTTPException):
             "code": exc.status_code 
         }
     )
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.error(f"Unhandled exception on {request.url.path}, error: {str(exc)}")
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "success": False,
+            "message": "Internal server error",
+            "code": 500
+        }
+    )
     
 # Include route22rs
 app.include_router(resumes_router, prefix="/api/v1")
@@ -51,7 +64,17 @@ async def health_check():
 
 def main():    
     logger.info(f"Environment variables loaded successfully, test env: {os.getenv('TEST')}")
-    uvicorn.run("main:app")
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=int(os.getenv("PORT", 8000)),
+        # uvloop is not available on Windows, use the asyncio loop there
+        loop="asyncio" if platform.system() == "Windows" else "uvloop",
+        http="httptools",
+        # Every worker is a separate process with its own models, caches and LLM connection pool,
+        # so a single worker unless the deployment opts in to more
+        workers=int(os.getenv("WEB_CONCURRENCY", 1))
+    )
     
 
 if __name__ == "__main__":
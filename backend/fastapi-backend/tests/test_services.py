@@ -0,0 +1,45 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException, status
+
+from features.resume.services import ResumeAnalyzer
+
+
+def make_resume_analyzer(ai_analyzer) -> ResumeAnalyzer:
+    """ResumeAnalyzer with lightweight components, so no models or LLM clients are loaded"""
+    resume_analyzer = ResumeAnalyzer.__new__(ResumeAnalyzer)
+    resume_analyzer.text_extractor = SimpleNamespace(
+        extract_text_from_file=lambda file_path, file_type: "Jane Doe\nSoftware Engineer"
+    )
+    resume_analyzer.section_extractor = SimpleNamespace(extract_sections=lambda text: {})
+    resume_analyzer.llm_text_preparer = SimpleNamespace(
+        prepare_llm_text=lambda text, max_tokens=None: text,
+        truncate_to_tokens=lambda text, max_tokens: text
+    )
+    resume_analyzer.ai_analyzer = ai_analyzer
+    return resume_analyzer
+
+
+def test_analyze_resume_preserves_llm_provider_error():
+    async def rejected_by_provider(*args, **kwargs):
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="LLM provider rejected the request"
+        )
+    
+    resume_analyzer = make_resume_analyzer(
+        SimpleNamespace(get_batched_resume_analysis=rejected_by_provider)
+    )
+    
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(resume_analyzer.analyze_resume(
+            background_tasks=BackgroundTasks(),
+            user_id="user-id",
+            file_path="temp/resume.txt",
+            file_type="txt"
+        ))
+    
+    assert exc_info.value.status_code == status.HTTP_502_BAD_GATEWAY
+    assert exc_info.value.detail == "LLM provider rejected the request"